@@ -1,6 +1,6 @@
 """TMDL generation functions for database, model, expressions, and table components."""
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from semantic_model_generator.domain.types import (
     ColumnMetadata,
@@ -35,7 +35,7 @@ def generate_database_tmdl() -> str:
 def generate_model_tmdl(
     model_name: str,
     table_names: Sequence[str],
-    classifications: dict[tuple[str, str], TableClassification],
+    classifications: Mapping[tuple[str, str], TableClassification],
 ) -> str:
     """Generate model.tmdl file content.
 
@@ -135,16 +135,8 @@ def generate_expressions_tmdl(catalog_name: str) -> str:
     return content
 
 
-def generate_column_tmdl(column: ColumnMetadata, table_qualified_name: str) -> str:
-    """Generate TMDL for a single column.
-
-    Args:
-        column: Column metadata from schema discovery.
-        table_qualified_name: Fully qualified table name (schema.table).
-
-    Returns:
-        TMDL column definition with dataType, lineageTag, summarizeBy, sourceColumn.
-    """
+def _column_lines(column: ColumnMetadata, table_qualified_name: str) -> list[str]:
+    """Build the lines of a column section, without trailing newline or validation."""
     indent1 = indent_tmdl(1)
     indent2 = indent_tmdl(2)
 
@@ -157,16 +149,28 @@ def generate_column_tmdl(column: ColumnMetadata, table_qualified_name: str) -> s
     # Generate deterministic UUID for column
     lineage_tag = generate_deterministic_uuid("column", f"{table_qualified_name}.{column.name}")
 
-    # Build column definition
-    lines = [f"{indent1}column {quoted_name}"]
-    lines.append(f"{indent2}dataType: {tmdl_type.value}")
-    lines.append(f"{indent2}lineageTag: {lineage_tag}")
-    lines.append(f"{indent2}summarizeBy: none")
-    lines.append(f"{indent2}sourceColumn: {column.name}")
-    lines.append("")
-    lines.append(f"{indent2}annotation SummarizationSetBy = Automatic")
+    return [
+        f"{indent1}column {quoted_name}",
+        f"{indent2}dataType: {tmdl_type.value}",
+        f"{indent2}lineageTag: {lineage_tag}",
+        f"{indent2}summarizeBy: none",
+        f"{indent2}sourceColumn: {column.name}",
+        "",
+        f"{indent2}annotation SummarizationSetBy = Automatic",
+    ]
 
-    content = "\n".join(lines) + "\n"
+
+def generate_column_tmdl(column: ColumnMetadata, table_qualified_name: str) -> str:
+    """Generate TMDL for a single column.
+
+    Args:
+        column: Column metadata from schema discovery.
+        table_qualified_name: Fully qualified table name (schema.table).
+
+    Returns:
+        TMDL column definition with dataType, lineageTag, summarizeBy, sourceColumn.
+    """
+    content = "\n".join(_column_lines(column, table_qualified_name)) + "\n"
 
     # Validate before returning
     errors = validate_tmdl_indentation(content)
@@ -178,6 +182,25 @@ def generate_column_tmdl(column: ColumnMetadata, table_qualified_name: str) -> s
     return content
 
 
+def _partition_lines(table: TableMetadata, partition_name: str, catalog_name: str) -> list[str]:
+    """Build the lines of a partition section, without trailing newline or validation."""
+    indent1 = indent_tmdl(1)
+    indent2 = indent_tmdl(2)
+    indent3 = indent_tmdl(3)
+
+    # Quote partition name if needed
+    quoted_partition = quote_tmdl_identifier(partition_name)
+
+    return [
+        f"{indent1}partition {quoted_partition} = entity",
+        f"{indent2}mode: directLake",
+        f"{indent2}source =",
+        f"{indent3}entityName: {table.table_name}",
+        f"{indent3}expressionSource: 'DirectLake - {catalog_name}'",
+        f"{indent3}schemaName: {table.schema_name}",
+    ]
+
+
 def generate_partition_tmdl(table: TableMetadata, partition_name: str, catalog_name: str) -> str:
     """Generate TMDL for a DirectLake partition.
 
@@ -189,21 +212,7 @@ def generate_partition_tmdl(table: TableMetadata, partition_name: str, catalog_n
     Returns:
         TMDL partition definition with mode:directLake and source references.
     """
-    indent1 = indent_tmdl(1)
-    indent2 = indent_tmdl(2)
-    indent3 = indent_tmdl(3)
-
-    # Quote partition name if needed
-    quoted_partition = quote_tmdl_identifier(partition_name)
-
-    # Build partition definition
-    content = f"""{indent1}partition {quoted_partition} = entity
-{indent2}mode: directLake
-{indent2}source =
-{indent3}entityName: {table.table_name}
-{indent3}expressionSource: 'DirectLake - {catalog_name}'
-{indent3}schemaName: {table.schema_name}
-"""
+    content = "\n".join(_partition_lines(table, partition_name, catalog_name)) + "\n"
 
     # Validate before returning
     errors = validate_tmdl_indentation(content)
@@ -240,31 +249,23 @@ def generate_table_tmdl(
     # Generate deterministic UUID for table
     lineage_tag = generate_deterministic_uuid("table", f"{table.schema_name}.{table.table_name}")
 
-    # Sort columns: key columns first, then alphabetically by name
-    key_columns = [
-        col for col in table.columns if any(col.name.startswith(prefix) for prefix in key_prefixes)
-    ]
-    non_key_columns = [col for col in table.columns if col not in key_columns]
-
-    # Sort each group alphabetically
-    sorted_key_columns = sorted(key_columns, key=lambda c: c.name)
-    sorted_non_key_columns = sorted(non_key_columns, key=lambda c: c.name)
+    # Sort columns: key columns first, then alphabetically by name. One sort on
+    # (is_non_key, name) replaces splitting into key/non-key lists, which compared every
+    # column against the key list.
+    prefixes = tuple(key_prefixes)
+    all_columns = sorted(table.columns, key=lambda c: (not c.name.startswith(prefixes), c.name))
 
-    all_columns = sorted_key_columns + sorted_non_key_columns
+    # Compose table TMDL: header, partition section, then column sections. Sections are
+    # built as line lists and validated once as part of the whole table, not one by one.
+    lines = [f"table {quoted_table}", f"{indent1}lineageTag: {lineage_tag}", ""]
+    lines.extend(_partition_lines(table, table.table_name, catalog_name))
+    lines.append("")
 
-    # Generate column sections
     table_qualified_name = f"{table.schema_name}.{table.table_name}"
-    column_sections = [generate_column_tmdl(col, table_qualified_name) for col in all_columns]
-
-    # Generate partition section
-    partition_section = generate_partition_tmdl(table, table.table_name, catalog_name)
+    for col in all_columns:
+        lines.extend(_column_lines(col, table_qualified_name))
 
-    # Compose table TMDL
-    content = f"""table {quoted_table}
-{indent1}lineageTag: {lineage_tag}
-
-{partition_section}
-{"".join(column_sections)}"""
+    content = "\n".join(lines) + "\n"
 
     # Validate before returning
     errors = validate_tmdl_indentation(content)
@@ -339,7 +340,7 @@ def generate_relationships_tmdl(relationships: Sequence[Relationship]) -> str:
 def generate_all_tmdl(
     model_name: str,
     tables: Sequence[TableMetadata],
-    classifications: dict[tuple[str, str], TableClassification],
+    classifications: Mapping[tuple[str, str], TableClassification],
     relationships: Sequence[Relationship],
     key_prefixes: Sequence[str],
     catalog_name: str,
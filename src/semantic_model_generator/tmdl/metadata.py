@@ -1,7 +1,7 @@
 """TMDL metadata file generators for .platform, definition.pbism, and diagramLayout.json."""
 
 import json
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 
 from semantic_model_generator.domain.types import (
@@ -10,6 +10,28 @@ from semantic_model_generator.domain.types import (
 )
 from semantic_model_generator.utils.uuid_gen import generate_deterministic_uuid
 
+# Shared encoder for all metadata files. json.dumps builds a new JSONEncoder on every
+# call when given non-default options; reusing one keeps the same output without that.
+_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
+
+
+# .platform JSON rendered once at import with placeholder values; only the logicalId and
+# displayName differ between models. Each placeholder, quotes included, is later replaced
+# by the JSON encoding of the real value.
+_PLATFORM_TEMPLATE = _JSON_ENCODER.encode(
+    {
+        "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
+        "config": {
+            "logicalId": "__LOGICAL_ID__",
+            "version": "2.0",
+        },
+        "metadata": {
+            "displayName": "__DISPLAY_NAME__",
+            "type": "SemanticModel",
+        },
+    }
+)
+
 
 def generate_platform_json(model_name: str) -> str:
     """Generate .platform JSON file content.
@@ -21,21 +43,13 @@ def generate_platform_json(model_name: str) -> str:
         JSON string with fabric gitIntegration schema, SemanticModel type,
         displayName, and deterministic logicalId.
     """
-    logical_id = generate_deterministic_uuid("platform", model_name)
+    # A UUID string is only hex digits and dashes, so quoting it is its full JSON encoding
+    logical_id = f'"{generate_deterministic_uuid("platform", model_name)}"'
 
-    platform_data = {
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
-        "config": {
-            "logicalId": str(logical_id),
-            "version": "2.0",
-        },
-        "metadata": {
-            "displayName": model_name,
-            "type": "SemanticModel",
-        },
-    }
-
-    return json.dumps(platform_data, indent=2, sort_keys=True)
+    # Display name is substituted last so its text is never scanned for the other placeholder
+    return _PLATFORM_TEMPLATE.replace('"__LOGICAL_ID__"', logical_id).replace(
+        '"__DISPLAY_NAME__"', _JSON_ENCODER.encode(model_name)
+    )
 
 
 def generate_definition_pbism_json(
@@ -74,12 +88,12 @@ def generate_definition_pbism_json(
         "version": "4.2",
     }
 
-    return json.dumps(definition_data, indent=2, sort_keys=True)
+    return _JSON_ENCODER.encode(definition_data)
 
 
 def generate_diagram_layout_json(
     tables: Sequence[TableMetadata],
-    classifications: dict[tuple[str, str], TableClassification],
+    classifications: Mapping[tuple[str, str], TableClassification],
 ) -> str:
     """Generate diagramLayout.json file content.
 
@@ -117,43 +131,40 @@ def generate_diagram_layout_json(
     dimensions.sort(key=lambda t: (t.schema_name, t.table_name))
     facts.sort(key=lambda t: (t.schema_name, t.table_name))
 
-    # Layout: dimensions in horizontal row(s), facts in vertical column to the right
-    table_entries = []
+    # Layout: dimensions in horizontal row(s), facts in vertical column to the right.
+    # Positions are arithmetic progressions, so compute each one from its index.
+    x_step = table_width + x_gap
+    y_step = table_height + y_gap
 
     # Layout dimensions horizontally (incrementing x)
-    dim_x = 0
-    dim_y = 0
-    for dim in dimensions:
-        table_entries.append(
-            {
-                "name": dim.table_name,
-                "x": dim_x,
-                "y": dim_y,
-                "width": table_width,
-                "height": table_height,
-            }
-        )
-        dim_x += table_width + x_gap
+    table_entries = [
+        {
+            "name": dim.table_name,
+            "x": index * x_step,
+            "y": 0,
+            "width": table_width,
+            "height": table_height,
+        }
+        for index, dim in enumerate(dimensions)
+    ]
 
     # Layout facts vertically in column to the right of dimensions
     # Start facts at x position after all dimensions
-    fact_x = dim_x if dimensions else 0
-    fact_y = 0
-    for fact in facts:
-        table_entries.append(
-            {
-                "name": fact.table_name,
-                "x": fact_x,
-                "y": fact_y,
-                "width": table_width,
-                "height": table_height,
-            }
-        )
-        fact_y += table_height + y_gap
+    fact_x = len(dimensions) * x_step
+    table_entries.extend(
+        {
+            "name": fact.table_name,
+            "x": fact_x,
+            "y": index * y_step,
+            "width": table_width,
+            "height": table_height,
+        }
+        for index, fact in enumerate(facts)
+    )
 
     layout_data = {
         "version": 1,
         "tables": table_entries,
     }
 
-    return json.dumps(layout_data, indent=2, sort_keys=True)
+    return _JSON_ENCODER.encode(layout_data)
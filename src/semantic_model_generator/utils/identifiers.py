@@ -6,6 +6,9 @@ single quotes) to be wrapped in single quotes. Internal single quotes are escape
 
 import re
 
+# Any character that forces an identifier to be quoted: whitespace, '.', '=', ':', "'"
+_NEEDS_QUOTING = re.compile(r"[\s.=:']")
+
 
 def quote_tmdl_identifier(identifier: str) -> str:
     """Quote a TMDL identifier if it contains special characters.
@@ -33,8 +36,12 @@ def quote_tmdl_identifier(identifier: str) -> str:
     if not identifier:
         raise ValueError("Identifier cannot be empty")
 
+    # ASCII Python identifiers are only letters, digits and underscores: never quoted
+    if identifier.isascii() and identifier.isidentifier():
+        return identifier
+
     # Check if quoting is needed (any special character present)
-    needs_quoting = re.search(r"[\s.=:']", identifier) is not None
+    needs_quoting = _NEEDS_QUOTING.search(identifier) is not None
 
     if not needs_quoting:
         return identifier
@@ -64,8 +71,8 @@ def unquote_tmdl_identifier(identifier: str) -> str:
     if not identifier:
         raise ValueError("Identifier cannot be empty")
 
-    # If no outer quotes, return unchanged
-    if not (identifier.startswith("'") and identifier.endswith("'")):
+    # If no outer quotes, return unchanged (indexing is safe: empty input was rejected above)
+    if identifier[0] != "'" or identifier[-1] != "'":
         return identifier
 
     # Remove outer quotes
@@ -30,6 +30,9 @@ SQL_TO_TMDL_TYPE: dict[str, TmdlDataType] = {
     "uniqueidentifier": TmdlDataType.BINARY,
 }
 
+# Sorted, comma-separated list of supported types for error messages, built once
+_SUPPORTED_TYPES = ", ".join(sorted(SQL_TO_TMDL_TYPE))
+
 
 def map_sql_type_to_tmdl(sql_type: str) -> TmdlDataType:
     """Map Microsoft Fabric warehouse SQL type to TMDL data type.
@@ -49,13 +52,19 @@ def map_sql_type_to_tmdl(sql_type: str) -> TmdlDataType:
         >>> map_sql_type_to_tmdl("INT")
         <TmdlDataType.INT64: 'int64'>
     """
-    normalized = sql_type.lower().strip()
+    # Fast path: discovery reports type names already lowercase and unpadded, so try the
+    # raw input before allocating a normalized copy
+    tmdl_type = SQL_TO_TMDL_TYPE.get(sql_type)
+    if tmdl_type is not None:
+        return tmdl_type
 
-    if not normalized:
-        raise ValueError("SQL type cannot be empty")
+    normalized = sql_type.lower().strip()
 
-    if normalized not in SQL_TO_TMDL_TYPE:
-        supported = ", ".join(sorted(SQL_TO_TMDL_TYPE.keys()))
-        raise ValueError(f"Unsupported SQL type: '{sql_type}'. Supported types: {supported}")
+    # Single lookup on the normalized path; the empty check only runs on a miss
+    tmdl_type = SQL_TO_TMDL_TYPE.get(normalized)
+    if tmdl_type is None:
+        if not normalized:
+            raise ValueError("SQL type cannot be empty")
+        raise ValueError(f"Unsupported SQL type: '{sql_type}'. Supported types: {_SUPPORTED_TYPES}")
 
-    return SQL_TO_TMDL_TYPE[normalized]
+    return tmdl_type
@@ -28,7 +28,10 @@ def generate_deterministic_uuid(object_type: str, object_name: str) -> uuid.UUID
     Raises:
         ValueError: If object_type or object_name is empty after stripping.
     """
-    normalized_type = object_type.strip().lower()
+    # Callers pass literal lowercase type names, so skip the lower() copy when it is a no-op
+    normalized_type = object_type.strip()
+    if not normalized_type.islower():
+        normalized_type = normalized_type.lower()
     normalized_name = object_name.strip()
 
     if not normalized_type:
@@ -36,5 +39,4 @@ def generate_deterministic_uuid(object_type: str, object_name: str) -> uuid.UUID
     if not normalized_name:
         raise ValueError("object_name cannot be empty")
 
-    composite_name = f"{normalized_type}:{normalized_name}"
-    return uuid.uuid5(SEMANTIC_MODEL_NAMESPACE, composite_name)
+    return uuid.uuid5(SEMANTIC_MODEL_NAMESPACE, f"{normalized_type}:{normalized_name}")
@@ -5,8 +5,15 @@ This module provides validation to detect space indentation and helpers
 to generate correct tab indentation.
 """
 
+import re
 from typing import NamedTuple
 
+# A whole line (newline excluded) that starts with one or more spaces; group 1 is the spaces
+_SPACE_INDENTED_LINE = re.compile(r"^( +)[^\n]*", re.MULTILINE)
+
+# Tab strings for the indentation levels TMDL generation uses, built once
+_INDENTS = tuple("\t" * level for level in range(16))
+
 
 class TmdlIndentationError(NamedTuple):
     """Structured error for TMDL indentation violations.
@@ -34,32 +41,37 @@ def validate_tmdl_indentation(content: str) -> list[TmdlIndentationError]:
     Returns:
         List of indentation errors. Empty list if content is valid.
     """
-    errors = []
-    lines = content.split("\n")
-
-    for line_num, line in enumerate(lines, start=1):
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Check if line starts with spaces
-        if line and line[0] == " ":
-            # Count leading spaces
-            space_count = len(line) - len(line.lstrip(" "))
-
-            # Truncate line content to 50 chars
-            truncated_line = line[:50]
-
-            msg = (
-                f"Line {line_num}: {space_count} leading space(s) detected. "
-                "TMDL requires tab indentation."
-            )
-            error = TmdlIndentationError(
-                line_number=line_num,
-                message=msg,
-                line_content=truncated_line,
-            )
-            errors.append(error)
+    errors: list[TmdlIndentationError] = []
+
+    # A space-indented line starts the content or follows a newline; both checks run as C
+    # substring searches, so valid content (the common case) never enters the regex loop
+    if not content.startswith(" ") and "\n " not in content:
+        return errors
+
+    # Scan the whole buffer once with a multiline regex rather than splitting it into a
+    # list of lines; only offending lines produce matches. Line numbers are tracked by
+    # counting newlines between consecutive matches.
+    line_num = 1
+    scanned_to = 0
+    for match in _SPACE_INDENTED_LINE.finditer(content):
+        line_num += content.count("\n", scanned_to, match.start())
+        scanned_to = match.start()
+
+        space_count = len(match.group(1))
+
+        # Truncate line content to 50 chars
+        truncated_line = match.group()[:50]
+
+        msg = (
+            f"Line {line_num}: {space_count} leading space(s) detected. "
+            "TMDL requires tab indentation."
+        )
+        error = TmdlIndentationError(
+            line_number=line_num,
+            message=msg,
+            line_content=truncated_line,
+        )
+        errors.append(error)
 
     return errors
 
@@ -79,4 +91,6 @@ def indent_tmdl(level: int) -> str:
     if level < 0:
         raise ValueError("Indentation level must be non-negative")
 
+    if level < len(_INDENTS):
+        return _INDENTS[level]
     return "\t" * level
@@ -1,6 +1,9 @@
 """Tests for pipeline orchestration module."""
 
+from collections.abc import Iterator
+from contextlib import ExitStack
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -707,18 +710,38 @@ class TestGenerateSemanticModelFabricMode:
 class TestPipelineErrorStages:
     """Test error wrapping for remaining pipeline stages."""
 
-    @patch("semantic_model_generator.pipeline.filter_tables")
-    @patch("semantic_model_generator.pipeline.discover_tables")
-    @patch("semantic_model_generator.pipeline.create_fabric_connection")
-    def test_filtering_error_wraps(
-        self, mock_connect: MagicMock, mock_discover: MagicMock, mock_filter: MagicMock
-    ) -> None:
-        """filter_tables failure -> PipelineError stage=filtering."""
-        mock_connect.return_value = MagicMock()
-        mock_discover.return_value = (TableMetadata("dbo", "T", ()),)
-        mock_filter.side_effect = ValueError("Filter failed")
-
-        config = PipelineConfig(
+    @pytest.fixture
+    def pipeline_mocks(self) -> Iterator[SimpleNamespace]:
+        """Patch the pre-output pipeline stages with a succeeding single-table run.
+
+        Tests make one stage fail by setting its side_effect.
+        """
+        stages = {
+            "connect": "create_fabric_connection",
+            "discover": "discover_tables",
+            "filter": "filter_tables",
+            "classify": "classify_tables",
+            "infer": "infer_relationships",
+            "generate": "generate_all_tmdl",
+        }
+        with ExitStack() as stack:
+            mocks = SimpleNamespace(
+                **{
+                    key: stack.enter_context(patch(f"semantic_model_generator.pipeline.{target}"))
+                    for key, target in stages.items()
+                }
+            )
+            mock_tables = (TableMetadata("dbo", "T", ()),)
+            mocks.discover.return_value = mock_tables
+            mocks.filter.return_value = mock_tables
+            mocks.classify.return_value = {("dbo", "T"): TableClassification.FACT}
+            mocks.infer.return_value = ()
+            yield mocks
+
+    @pytest.fixture
+    def config(self) -> PipelineConfig:
+        """Minimal folder mode config; output is never reached in these tests."""
+        return PipelineConfig(
             sql_endpoint="ep",
             database="db",
             schemas=("dbo",),
@@ -728,39 +751,23 @@ class TestPipelineErrorStages:
             output_path=Path("/tmp"),
         )
 
+    def test_filtering_error_wraps(
+        self, pipeline_mocks: SimpleNamespace, config: PipelineConfig
+    ) -> None:
+        """filter_tables failure -> PipelineError stage=filtering."""
+        pipeline_mocks.filter.side_effect = ValueError("Filter failed")
+
         with pytest.raises(PipelineError) as exc_info:
             generate_semantic_model(config)
 
         assert exc_info.value.stage == "filtering"
         assert isinstance(exc_info.value.cause, ValueError)
 
-    @patch("semantic_model_generator.pipeline.classify_tables")
-    @patch("semantic_model_generator.pipeline.filter_tables")
-    @patch("semantic_model_generator.pipeline.discover_tables")
-    @patch("semantic_model_generator.pipeline.create_fabric_connection")
     def test_classification_error_wraps(
-        self,
-        mock_connect: MagicMock,
-        mock_discover: MagicMock,
-        mock_filter: MagicMock,
-        mock_classify: MagicMock,
+        self, pipeline_mocks: SimpleNamespace, config: PipelineConfig
     ) -> None:
         """classify_tables failure -> PipelineError stage=classification."""
-        mock_connect.return_value = MagicMock()
-        mock_tables = (TableMetadata("dbo", "T", ()),)
-        mock_discover.return_value = mock_tables
-        mock_filter.return_value = mock_tables
-        mock_classify.side_effect = RuntimeError("Classification failed")
-
-        config = PipelineConfig(
-            sql_endpoint="ep",
-            database="db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="M",
-            catalog_name="cat",
-            output_path=Path("/tmp"),
-        )
+        pipeline_mocks.classify.side_effect = RuntimeError("Classification failed")
 
         with pytest.raises(PipelineError) as exc_info:
             generate_semantic_model(config)
@@ -768,36 +775,11 @@ class TestPipelineErrorStages:
         assert exc_info.value.stage == "classification"
         assert isinstance(exc_info.value.cause, RuntimeError)
 
-    @patch("semantic_model_generator.pipeline.infer_relationships")
-    @patch("semantic_model_generator.pipeline.classify_tables")
-    @patch("semantic_model_generator.pipeline.filter_tables")
-    @patch("semantic_model_generator.pipeline.discover_tables")
-    @patch("semantic_model_generator.pipeline.create_fabric_connection")
     def test_relationship_error_wraps(
-        self,
-        mock_connect: MagicMock,
-        mock_discover: MagicMock,
-        mock_filter: MagicMock,
-        mock_classify: MagicMock,
-        mock_infer: MagicMock,
+        self, pipeline_mocks: SimpleNamespace, config: PipelineConfig
     ) -> None:
         """infer_relationships failure -> PipelineError stage=relationships."""
-        mock_connect.return_value = MagicMock()
-        mock_tables = (TableMetadata("dbo", "T", ()),)
-        mock_discover.return_value = mock_tables
-        mock_filter.return_value = mock_tables
-        mock_classify.return_value = {("dbo", "T"): TableClassification.FACT}
-        mock_infer.side_effect = ValueError("Relationship inference failed")
-
-        config = PipelineConfig(
-            sql_endpoint="ep",
-            database="db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="M",
-            catalog_name="cat",
-            output_path=Path("/tmp"),
-        )
+        pipeline_mocks.infer.side_effect = ValueError("Relationship inference failed")
 
         with pytest.raises(PipelineError) as exc_info:
             generate_semantic_model(config)
@@ -805,39 +787,11 @@ class TestPipelineErrorStages:
         assert exc_info.value.stage == "relationships"
         assert isinstance(exc_info.value.cause, ValueError)
 
-    @patch("semantic_model_generator.pipeline.generate_all_tmdl")
-    @patch("semantic_model_generator.pipeline.infer_relationships")
-    @patch("semantic_model_generator.pipeline.classify_tables")
-    @patch("semantic_model_generator.pipeline.filter_tables")
-    @patch("semantic_model_generator.pipeline.discover_tables")
-    @patch("semantic_model_generator.pipeline.create_fabric_connection")
     def test_tmdl_generation_error_wraps(
-        self,
-        mock_connect: MagicMock,
-        mock_discover: MagicMock,
-        mock_filter: MagicMock,
-        mock_classify: MagicMock,
-        mock_infer: MagicMock,
-        mock_generate: MagicMock,
+        self, pipeline_mocks: SimpleNamespace, config: PipelineConfig
     ) -> None:
         """generate_all_tmdl failure -> PipelineError stage=tmdl_generation."""
-        mock_connect.return_value = MagicMock()
-        mock_tables = (TableMetadata("dbo", "T", ()),)
-        mock_discover.return_value = mock_tables
-        mock_filter.return_value = mock_tables
-        mock_classify.return_value = {("dbo", "T"): TableClassification.FACT}
-        mock_infer.return_value = ()
-        mock_generate.side_effect = RuntimeError("TMDL generation failed")
-
-        config = PipelineConfig(
-            sql_endpoint="ep",
-            database="db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="M",
-            catalog_name="cat",
-            output_path=Path("/tmp"),
-        )
+        pipeline_mocks.generate.side_effect = RuntimeError("TMDL generation failed")
 
         with pytest.raises(PipelineError) as exc_info:
             generate_semantic_model(config)
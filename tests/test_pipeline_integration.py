@@ -4,9 +4,17 @@ These tests verify the complete pipeline from schema discovery through TMDL file
 using representative warehouse schemas. The tests mock only the database connection layer
 (mssql_python), exercising real filtering, classification, relationship inference, TMDL
 generation, and folder writing code paths.
+
+Every test writes to its own temporary folder and patches its own connection mocks, so the
+module is safe to run under pytest-xdist. Use ``--dist=loadscope`` (``make test-parallel``)
+so each class-scoped pipeline run is shared by its tests on a single worker.
 """
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -33,21 +41,46 @@ STAR_SCHEMA_ROWS = [
     ("dbo", "FactSales", "Quantity", "int", "NO", 5, None, 10, 0),
 ]
 
-
-@pytest.fixture
-def mock_connection():
-    """Fixture providing a mocked database connection with star schema test data.
-
-    Patches semantic_model_generator.schema.connection.mssql_python and returns a mock
-    connection whose cursor returns STAR_SCHEMA_ROWS.
-    """
+# Files every folder-mode run of the star schema must produce, relative to the output folder
+EXPECTED_FOLDER_FILES = frozenset(
+    {
+        ".platform",
+        "definition.pbism",
+        "definition/database.tmdl",
+        "definition/model.tmdl",
+        "definition/expressions.tmdl",
+        "definition/relationships.tmdl",
+        "definition/tables/DimCustomer.tmdl",
+        "definition/tables/DimProduct.tmdl",
+        "definition/tables/FactSales.tmdl",
+        "diagramLayout.json",
+    }
+)
+
+# Config shared by every integration test. output_path is a placeholder: tests derive their
+# own config with dataclasses.replace(BASE_CONFIG, output_path=tmp_path, ...).
+BASE_CONFIG = PipelineConfig(
+    sql_endpoint="test-endpoint.fabric.microsoft.com",
+    database="test_db",
+    schemas=("dbo",),
+    key_prefixes=("SK_",),
+    model_name="TestModel",
+    catalog_name="test_catalog",
+    output_mode="folder",
+    output_path=Path("placeholder"),
+)
+
+
+@contextmanager
+def patched_mssql(rows: list[tuple[object, ...]]) -> Iterator[MagicMock]:
+    """Patch mssql_python so every cursor returns the given INFORMATION_SCHEMA rows."""
     with patch("semantic_model_generator.schema.connection.mssql_python") as mock_mssql:
         # Create mock connection and cursor
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
 
-        # Configure cursor to return star schema test data
-        mock_cursor.fetchall.return_value = STAR_SCHEMA_ROWS
+        # Configure cursor to return the test data
+        mock_cursor.fetchall.return_value = rows
 
         # Wire up the mock chain: connect() -> connection -> cursor() -> cursor
         mock_conn.cursor.return_value = mock_cursor
@@ -56,152 +89,89 @@ def mock_connection():
         yield mock_mssql
 
 
-class TestEndToEndFolderOutput:
-    """Integration tests for end-to-end pipeline with folder output mode."""
-
-    def test_full_pipeline_creates_tmdl_folder(
-        self, mock_connection: MagicMock, tmp_path: Path
-    ) -> None:
-        """Complete pipeline creates folder with all expected TMDL files."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
-
-        result = generate_semantic_model(config)
+@pytest.fixture
+def mock_connection():
+    """Fixture providing a mocked database connection with star schema test data.
 
-        # Verify result structure
-        assert result["mode"] == "folder"
-        assert result["output_path"].exists()
+    Patches semantic_model_generator.schema.connection.mssql_python and returns a mock
+    connection whose cursor returns STAR_SCHEMA_ROWS.
+    """
+    with patched_mssql(STAR_SCHEMA_ROWS) as mock_mssql:
+        yield mock_mssql
 
-        # Verify key files exist
-        output_dir = result["output_path"]
-        assert (output_dir / ".platform").exists()
-        assert (output_dir / "definition.pbism").exists()
-        assert (output_dir / "definition" / "database.tmdl").exists()
-        assert (output_dir / "definition" / "model.tmdl").exists()
-        assert (output_dir / "definition" / "expressions.tmdl").exists()
-        assert (output_dir / "definition" / "relationships.tmdl").exists()
-        assert (output_dir / "definition" / "tables" / "DimCustomer.tmdl").exists()
-        assert (output_dir / "definition" / "tables" / "DimProduct.tmdl").exists()
-        assert (output_dir / "definition" / "tables" / "FactSales.tmdl").exists()
-        assert (output_dir / "diagramLayout.json").exists()
-
-    def test_dimension_classification_correct(
-        self, mock_connection: MagicMock, tmp_path: Path
-    ) -> None:
-        """Dimension tables classified correctly in generated TMDL."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
 
-        result = generate_semantic_model(config)
-        output_dir = result["output_path"]
+@pytest.fixture(scope="class")
+def generated_model(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Any]:
+    """Run the star schema pipeline once per test class and return its result.
 
-        # Read dimension table files and verify they contain table definitions
-        dim_customer = (output_dir / "definition" / "tables" / "DimCustomer.tmdl").read_text()
-        dim_product = (output_dir / "definition" / "tables" / "DimProduct.tmdl").read_text()
-
-        assert "table DimCustomer" in dim_customer
-        assert "table DimProduct" in dim_product
-
-    def test_fact_classification_correct(self, mock_connection: MagicMock, tmp_path: Path) -> None:
-        """Fact table classified correctly in generated TMDL."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
+    Tests consuming this fixture must treat the generated folder as read-only.
+    """
+    config = replace(BASE_CONFIG, output_path=tmp_path_factory.mktemp("generated_model"))
+    with patched_mssql(STAR_SCHEMA_ROWS):
+        return generate_semantic_model(config)
 
-        result = generate_semantic_model(config)
-        output_dir = result["output_path"]
 
-        # Read fact table file and verify it contains table definition
-        fact_sales = (output_dir / "definition" / "tables" / "FactSales.tmdl").read_text()
-        assert "table FactSales" in fact_sales
-
-    def test_relationships_generated(self, mock_connection: MagicMock, tmp_path: Path) -> None:
-        """Relationships inferred and written to relationships.tmdl."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
+@pytest.fixture(scope="class")
+def tmdl_contents(generated_model: dict[str, Any]) -> dict[str, bytes]:
+    """Read every generated .tmdl file once, keyed by POSIX path relative to the output folder.
 
-        result = generate_semantic_model(config)
-        output_dir = result["output_path"]
+    Contents are kept as raw bytes: the assertions only check ASCII needles, so decoding is
+    unnecessary.
+    """
+    output_dir = generated_model["output_path"]
+    return {
+        p.relative_to(output_dir).as_posix(): p.read_bytes() for p in output_dir.rglob("*.tmdl")
+    }
 
-        # Read relationships file and verify it contains expected relationships
-        relationships = (output_dir / "definition" / "relationships.tmdl").read_text()
 
-        # Should have relationships for SK_Customer and SK_Product
-        assert "SK_Customer" in relationships
-        assert "SK_Product" in relationships
+class TestEndToEndFolderOutput:
+    """Integration tests for end-to-end pipeline with folder output mode."""
 
-    def test_role_playing_dimension_detected(
+    def test_full_pipeline_creates_tmdl_folder(
         self, mock_connection: MagicMock, tmp_path: Path
     ) -> None:
-        """Role-playing dimension creates both active and inactive relationships."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
+        """Complete pipeline creates folder with all expected TMDL files."""
+        config = replace(BASE_CONFIG, output_path=tmp_path)
 
         result = generate_semantic_model(config)
-        output_dir = result["output_path"]
 
-        # Read relationships file
-        relationships = (output_dir / "definition" / "relationships.tmdl").read_text()
+        # Verify result structure
+        assert result["mode"] == "folder"
+        assert result["output_path"].exists()
 
-        # Should have both customer relationships (one active, one inactive)
-        assert "SK_Customer_ShipTo" in relationships
-        # Inactive relationship should have isActive: false
-        assert "isActive: false" in relationships
+        # Verify key files exist (single directory walk, POSIX-style relative paths)
+        output_dir = result["output_path"]
+        actual = {
+            p.relative_to(output_dir).as_posix() for p in output_dir.rglob("*") if p.is_file()
+        }
+        assert EXPECTED_FOLDER_FILES <= actual, f"Missing files: {EXPECTED_FOLDER_FILES - actual}"
+
+    @pytest.mark.parametrize(
+        ("path", "needles"),
+        [
+            ("definition/tables/DimCustomer.tmdl", [b"table DimCustomer"]),
+            ("definition/tables/DimProduct.tmdl", [b"table DimProduct"]),
+            ("definition/tables/FactSales.tmdl", [b"table FactSales"]),
+            # SK_Customer_ShipTo is the role-playing customer key (inactive relationship)
+            (
+                "definition/relationships.tmdl",
+                [b"SK_Customer", b"SK_Product", b"SK_Customer_ShipTo", b"isActive: false"],
+            ),
+        ],
+    )
+    def test_generated_tmdl_contains(
+        self, tmdl_contents: dict[str, bytes], path: str, needles: list[bytes]
+    ) -> None:
+        """Classified tables and inferred relationships appear in the generated TMDL."""
+        text = tmdl_contents[path]
+        for needle in needles:
+            assert needle in text, f"{needle!r} not found in {path}"
 
     def test_dev_mode_creates_timestamped_folder(
         self, mock_connection: MagicMock, tmp_path: Path
     ) -> None:
         """Dev mode appends timestamp to folder name."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-            dev_mode=True,
-        )
+        config = replace(BASE_CONFIG, output_path=tmp_path, dev_mode=True)
 
         result = generate_semantic_model(config)
 
@@ -214,16 +184,7 @@ class TestEndToEndFolderOutput:
         self, mock_connection: MagicMock, tmp_path: Path
     ) -> None:
         """WriteSummary contains all written files."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
+        config = replace(BASE_CONFIG, output_path=tmp_path)
 
         result = generate_semantic_model(config)
         summary = result["summary"]
@@ -239,51 +200,33 @@ class TestEndToEndWithFiltering:
 
     def test_include_filter_limits_tables(self, mock_connection: MagicMock, tmp_path: Path) -> None:
         """include_tables limits output to specified tables."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-            include_tables=("DimCustomer", "FactSales"),
+        config = replace(
+            BASE_CONFIG, output_path=tmp_path, include_tables=("DimCustomer", "FactSales")
         )
 
         result = generate_semantic_model(config)
-        output_dir = result["output_path"]
+        tables_dir = result["output_path"] / "definition" / "tables"
 
         # Should have DimCustomer and FactSales
-        assert (output_dir / "definition" / "tables" / "DimCustomer.tmdl").exists()
-        assert (output_dir / "definition" / "tables" / "FactSales.tmdl").exists()
+        assert (tables_dir / "DimCustomer.tmdl").exists()
+        assert (tables_dir / "FactSales.tmdl").exists()
         # Should NOT have DimProduct
-        assert not (output_dir / "definition" / "tables" / "DimProduct.tmdl").exists()
+        assert not (tables_dir / "DimProduct.tmdl").exists()
 
     def test_exclude_filter_removes_tables(
         self, mock_connection: MagicMock, tmp_path: Path
     ) -> None:
         """exclude_tables removes specified tables from output."""
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-            exclude_tables=("DimProduct",),
-        )
+        config = replace(BASE_CONFIG, output_path=tmp_path, exclude_tables=("DimProduct",))
 
         result = generate_semantic_model(config)
-        output_dir = result["output_path"]
+        tables_dir = result["output_path"] / "definition" / "tables"
 
         # Should have DimCustomer and FactSales
-        assert (output_dir / "definition" / "tables" / "DimCustomer.tmdl").exists()
-        assert (output_dir / "definition" / "tables" / "FactSales.tmdl").exists()
+        assert (tables_dir / "DimCustomer.tmdl").exists()
+        assert (tables_dir / "FactSales.tmdl").exists()
         # Should NOT have DimProduct
-        assert not (output_dir / "definition" / "tables" / "DimProduct.tmdl").exists()
+        assert not (tables_dir / "DimProduct.tmdl").exists()
 
 
 class TestEndToEndErrorPaths:
@@ -295,65 +238,42 @@ class TestEndToEndErrorPaths:
             # Make connection raise an exception
             mock_mssql.connect.side_effect = RuntimeError("Connection failed")
 
-            config = PipelineConfig(
-                sql_endpoint="test-endpoint.fabric.microsoft.com",
-                database="test_db",
-                schemas=("dbo",),
-                key_prefixes=("SK_",),
-                model_name="TestModel",
-                catalog_name="test_catalog",
-                output_mode="folder",
-                output_path=tmp_path,
-            )
+            config = replace(BASE_CONFIG, output_path=tmp_path)
 
             with pytest.raises(PipelineError) as exc_info:
                 generate_semantic_model(config)
 
             assert exc_info.value.stage == "connection"
 
-    def test_empty_schema_result_handled(self, mock_connection: MagicMock, tmp_path: Path) -> None:
+    def test_empty_schema_result_handled(self, tmp_path: Path) -> None:
         """Empty schema result handled gracefully."""
-        # Override mock to return empty result
-        mock_connection.connect.return_value.cursor.return_value.fetchall.return_value = []
-
-        config = PipelineConfig(
-            sql_endpoint="test-endpoint.fabric.microsoft.com",
-            database="test_db",
-            schemas=("dbo",),
-            key_prefixes=("SK_",),
-            model_name="TestModel",
-            catalog_name="test_catalog",
-            output_mode="folder",
-            output_path=tmp_path,
-        )
+        # Patch locally with no rows instead of mutating a shared star schema mock
+        with patched_mssql([]):
+            config = replace(BASE_CONFIG, output_path=tmp_path)
 
-        result = generate_semantic_model(config)
+            result = generate_semantic_model(config)
 
         # Should complete successfully with no table files
         assert result["mode"] == "folder"
         tables_dir = result["output_path"] / "definition" / "tables"
         if tables_dir.exists():
-            table_files = list(tables_dir.glob("*.tmdl"))
-            assert len(table_files) == 0
+            assert next(tables_dir.glob("*.tmdl"), None) is None
 
 
 class TestPublicApiImports:
     """Test public API exports from top-level package."""
 
-    def test_import_generate_semantic_model(self) -> None:
-        """Can import generate_semantic_model from top-level package."""
-        from semantic_model_generator import generate_semantic_model
-
-        assert callable(generate_semantic_model)
-
-    def test_import_pipeline_config(self) -> None:
-        """Can import PipelineConfig from top-level package."""
-        from semantic_model_generator import PipelineConfig
-
-        assert PipelineConfig is not None
-
-    def test_import_pipeline_error(self) -> None:
-        """Can import PipelineError from top-level package."""
-        from semantic_model_generator import PipelineError
-
-        assert issubclass(PipelineError, Exception)
+    @pytest.mark.parametrize(
+        ("name", "check"),
+        [
+            ("generate_semantic_model", callable),
+            ("PipelineConfig", lambda obj: obj is not None),
+            ("PipelineError", lambda obj: issubclass(obj, Exception)),
+        ],
+    )
+    def test_public_api_export(self, name: str, check: Callable[[Any], bool]) -> None:
+        """Public API names are importable from the top-level package."""
+        import semantic_model_generator
+
+        assert name in semantic_model_generator.__all__
+        assert check(getattr(semantic_model_generator, name))
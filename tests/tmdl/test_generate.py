@@ -1,7 +1,14 @@
 """Tests for TMDL generation functions."""
 
+import functools
+import itertools
 import json
+import re
 import uuid
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
 
 from semantic_model_generator.domain.types import (
     ColumnMetadata,
@@ -20,8 +27,40 @@ from semantic_model_generator.tmdl.generate import (
     generate_table_tmdl,
 )
 from semantic_model_generator.utils.identifiers import quote_tmdl_identifier
+from semantic_model_generator.utils.uuid_gen import generate_deterministic_uuid
 from semantic_model_generator.utils.whitespace import validate_tmdl_indentation
 
+pytestmark = pytest.mark.tmdl_generate
+
+# (table_names, classifications) pair accepted by generate_model_tmdl
+DimFactInputs = tuple[tuple[str, ...], Mapping[tuple[str, str], TableClassification]]
+
+# (tables, classifications, relationships) triple accepted by generate_all_tmdl
+AllTmdlInputs = tuple[
+    tuple[TableMetadata, ...],
+    Mapping[tuple[str, str], TableClassification],
+    tuple[Relationship, ...],
+]
+
+# dbo.DimCustomer (dimension) and dbo.FactSales (fact), shared read-only across tests
+_TABLE_NAMES_DIM_FACT = ("dbo.DimCustomer", "dbo.FactSales")
+_CLASSIFICATIONS_DIM_FACT: Mapping[tuple[str, str], TableClassification] = MappingProxyType(
+    {
+        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
+        ("dbo", "FactSales"): TableClassification.FACT,
+    }
+)
+
+# Expected quoted forms of identifiers containing spaces, computed once at import
+QUOTED_DIM_CUSTOMER = quote_tmdl_identifier("Dim Customer")
+QUOTED_CUSTOMER_NAME = quote_tmdl_identifier("Customer Name")
+
+# Captures each table name in model.tmdl "ref table" lines, in output order
+_REF_TABLE_RE = re.compile(r"ref table (\S+)")
+
+# Relationship ids only need to be unique within the module, so count instead of uuid4()
+_relationship_ids = itertools.count(1)
+
 
 # Helper functions to create test fixtures (same pattern as test_relationships.py)
 def make_column(
@@ -39,9 +78,9 @@ def make_column(
     )
 
 
-def make_table(schema: str, table: str, columns: list[ColumnMetadata]) -> TableMetadata:
-    """Create a TableMetadata for testing."""
-    return TableMetadata(schema_name=schema, table_name=table, columns=tuple(columns))
+def make_table(schema: str, table: str, columns: tuple[ColumnMetadata, ...]) -> TableMetadata:
+    """Create a TableMetadata for testing; columns are used as-is, without copying."""
+    return TableMetadata(schema_name=schema, table_name=table, columns=columns)
 
 
 def make_relationship(
@@ -51,8 +90,8 @@ def make_relationship(
     to_column: str,
     is_active: bool = True,
 ) -> Relationship:
-    """Create a Relationship for testing."""
-    rel_id = uuid.uuid4()
+    """Create a Relationship for testing with a unique, counter-based id."""
+    rel_id = uuid.UUID(int=next(_relationship_ids))
     return Relationship(
         id=rel_id,
         from_table=from_table,
@@ -63,418 +102,383 @@ def make_relationship(
     )
 
 
-# generate_database_tmdl tests
-def test_generate_database_tmdl_contains_database_header() -> None:
-    """Database TMDL contains 'database' as first line."""
-    output = generate_database_tmdl()
-    lines = output.split("\n")
-    assert lines[0] == "database"
-
-
-def test_generate_database_tmdl_contains_compatibility_level() -> None:
-    """Database TMDL contains compatibilityLevel: 1604."""
-    output = generate_database_tmdl()
-    assert "\tcompatibilityLevel: 1604" in output
-
-
-def test_generate_database_tmdl_passes_whitespace_validation() -> None:
-    """Database TMDL passes whitespace validation (tabs only)."""
-    output = generate_database_tmdl()
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
-
-
-# generate_model_tmdl tests
-def test_generate_model_tmdl_starts_with_model_header() -> None:
-    """Model TMDL starts with 'model Model'."""
-    output = generate_model_tmdl("TestModel", [], {})
-    lines = output.split("\n")
-    assert lines[0] == "model Model"
-
-
-def test_generate_model_tmdl_contains_culture_en_us() -> None:
-    """Model TMDL contains culture: en-US."""
-    output = generate_model_tmdl("TestModel", [], {})
-    assert "\tculture: en-US" in output
-
-
-def test_generate_model_tmdl_contains_default_powerbi_datasource_version() -> None:
-    """Model TMDL contains defaultPowerBIDataSourceVersion: powerBI_V3."""
-    output = generate_model_tmdl("TestModel", [], {})
-    assert "\tdefaultPowerBIDataSourceVersion: powerBI_V3" in output
+@functools.cache
+def lines_of(output: str) -> tuple[str, ...]:
+    """Split output into lines once; repeated calls for the same output reuse the tuple."""
+    return tuple(output.splitlines())
 
 
-def test_generate_model_tmdl_contains_discourage_implicit_measures() -> None:
-    """Model TMDL contains discourageImplicitMeasures."""
-    output = generate_model_tmdl("TestModel", [], {})
-    assert "\tdiscourageImplicitMeasures" in output
+@functools.cache
+def line_set(output: str) -> frozenset[str]:
+    """Split output into a set of lines once, for O(1) exact-line membership checks."""
+    return frozenset(lines_of(output))
 
 
-def test_generate_model_tmdl_contains_ref_table_lines() -> None:
-    """Model TMDL contains ref table lines for each table."""
-    table_names = ["dbo.DimCustomer", "dbo.FactSales"]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
-    output = generate_model_tmdl("TestModel", table_names, classifications)
+def ref_table_order(output: str) -> list[str]:
+    """Return the table names of model.tmdl ref table lines, in order, from one regex pass."""
+    return [match.group(1) for match in _REF_TABLE_RE.finditer(output)]
 
-    assert "\tref table DimCustomer" in output
-    assert "\tref table FactSales" in output
 
+def find_positions(output: str, needles: Sequence[str]) -> dict[str, int]:
+    """Return the first offset of each needle in output, found in a single regex pass.
 
-def test_generate_model_tmdl_dimensions_before_facts() -> None:
-    """Model TMDL lists dimension tables before fact tables."""
-    table_names = ["dbo.FactSales", "dbo.DimCustomer", "dbo.DimProduct"]
-    classifications = {
-        ("dbo", "FactSales"): TableClassification.FACT,
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "DimProduct"): TableClassification.DIMENSION,
-    }
-    output = generate_model_tmdl("TestModel", table_names, classifications)
+    Raises AssertionError if any needle is missing, so ordering checks never compare -1.
+    """
+    pattern = re.compile("|".join(map(re.escape, needles)))
+    positions: dict[str, int] = {}
+    for match in pattern.finditer(output):
+        positions.setdefault(match.group(), match.start())
+    missing = set(needles) - positions.keys()
+    assert not missing, f"Not found in output: {sorted(missing)}"
+    return positions
 
-    # Find positions of ref table lines
-    dim_customer_pos = output.find("ref table DimCustomer")
-    dim_product_pos = output.find("ref table DimProduct")
-    fact_sales_pos = output.find("ref table FactSales")
 
-    # Dimensions should appear before facts
-    assert dim_customer_pos < fact_sales_pos
-    assert dim_product_pos < fact_sales_pos
+@functools.cache
+def render_column(name: str, sql_type: str, table_name: str) -> str:
+    """Column TMDL for one (name, sql_type, table_name) input, generated once per input."""
+    return generate_column_tmdl(make_column(name, sql_type=sql_type), table_name)
 
 
-def test_generate_model_tmdl_alphabetical_within_classification() -> None:
-    """Model TMDL sorts tables alphabetically within same classification."""
-    table_names = ["dbo.DimProduct", "dbo.DimCustomer"]
-    classifications = {
-        ("dbo", "DimProduct"): TableClassification.DIMENSION,
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-    }
-    output = generate_model_tmdl("TestModel", table_names, classifications)
-
-    dim_customer_pos = output.find("ref table DimCustomer")
-    dim_product_pos = output.find("ref table DimProduct")
-
-    # DimCustomer should appear before DimProduct (alphabetical)
-    assert dim_customer_pos < dim_product_pos
-
-
-def test_generate_model_tmdl_quotes_special_characters() -> None:
-    """Model TMDL quotes table names with special characters."""
-    table_names = ["dbo.Dim Customer"]  # Space in name
-    classifications = {("dbo", "Dim Customer"): TableClassification.DIMENSION}
-    output = generate_model_tmdl("TestModel", table_names, classifications)
-
-    quoted_name = quote_tmdl_identifier("Dim Customer")
-    assert f"ref table {quoted_name}" in output
+@functools.cache
+def render_partition(schema: str, table: str, catalog_name: str) -> str:
+    """Partition TMDL for a one-column schema.table on catalog_name, generated once per input."""
+    return generate_partition_tmdl(
+        make_table(schema, table, (make_column("ID"),)), table, catalog_name
+    )
 
 
-def test_generate_model_tmdl_passes_whitespace_validation() -> None:
-    """Model TMDL passes whitespace validation."""
-    table_names = ["dbo.DimCustomer"]
-    classifications = {("dbo", "DimCustomer"): TableClassification.DIMENSION}
-    output = generate_model_tmdl("TestModel", table_names, classifications)
+def render_all_tmdl(inputs: AllTmdlInputs) -> dict[str, str]:
+    """Run generate_all_tmdl on inputs with the shared model settings."""
+    tables, classifications, relationships = inputs
+    return generate_all_tmdl(
+        model_name="TestModel",
+        tables=tables,
+        classifications=classifications,
+        relationships=relationships,
+        key_prefixes=["ID_"],
+        catalog_name="my_warehouse",
+    )
 
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
 
+# Shared generator inputs and outputs
+@pytest.fixture(scope="session")
+def dim_fact_inputs() -> DimFactInputs:
+    """Table names and classifications for dbo.DimCustomer (dimension) and dbo.FactSales (fact).
 
-# generate_expressions_tmdl tests
-def test_generate_expressions_tmdl_contains_directlake_expression() -> None:
-    """Expressions TMDL contains DirectLake expression with catalog name."""
-    catalog_name = "my_warehouse"
-    output = generate_expressions_tmdl(catalog_name)
+    Both are module-level read-only constants, so no test can mutate them.
+    """
+    return _TABLE_NAMES_DIM_FACT, _CLASSIFICATIONS_DIM_FACT
 
-    assert f"expression 'DirectLake - {catalog_name}'" in output
 
+@pytest.fixture(scope="session")
+def dim_customer_table() -> TableMetadata:
+    """Dimension dbo.DimCustomer with one key and two non-key columns.
 
-def test_generate_expressions_tmdl_contains_azure_storage_datalake() -> None:
-    """Expressions TMDL contains AzureStorage.DataLake reference."""
-    output = generate_expressions_tmdl("test_catalog")
-    assert "AzureStorage.DataLake" in output
-
+    Columns are passed out of order so the output exercises key-first, alphabetical sorting.
+    """
+    columns = (
+        make_column("Name", sql_type="varchar", ordinal=1),
+        make_column("ID_Customer", sql_type="bigint", ordinal=2),
+        make_column("City", sql_type="varchar", ordinal=3),
+    )
+    return make_table("dbo", "DimCustomer", columns)
 
-def test_generate_expressions_tmdl_contains_lineage_tag() -> None:
-    """Expressions TMDL contains lineageTag UUID."""
-    output = generate_expressions_tmdl("test_catalog")
-    assert "lineageTag:" in output
 
+@pytest.fixture(scope="session")
+def active_relationship() -> Relationship:
+    """Active relationship from dbo.FactSales to dbo.DimCustomer on ID_Customer."""
+    return make_relationship(
+        "dbo.FactSales", "ID_Customer", "dbo.DimCustomer", "ID_Customer", is_active=True
+    )
 
-def test_generate_expressions_tmdl_contains_pbi_annotation() -> None:
-    """Expressions TMDL contains PBI_IncludeFutureArtifacts annotation."""
-    output = generate_expressions_tmdl("test_catalog")
-    assert "annotation PBI_IncludeFutureArtifacts = False" in output
 
+@pytest.fixture(scope="session")
+def all_tmdl_inputs() -> AllTmdlInputs:
+    """Tables, classifications and relationships for a DimCustomer/FactSales model.
 
-def test_generate_expressions_tmdl_uses_en_us_locale() -> None:
-    """Expressions TMDL uses en-US locale (Source, not Swedish Kalla)."""
-    output = generate_expressions_tmdl("test_catalog")
-    # Should use English "Source" variable name, not Swedish
-    assert "Source = AzureStorage.DataLake" in output
-    assert "Kalla" not in output  # Swedish word should not appear
+    Built once so the relationship id stays the same for every generate_all_tmdl call.
+    """
+    tables = (
+        make_table("dbo", "DimCustomer", (make_column("ID_Customer", ordinal=1),)),
+        make_table("dbo", "FactSales", (make_column("ID_Customer", ordinal=1),)),
+    )
+    relationships = (
+        make_relationship("dbo.FactSales", "ID_Customer", "dbo.DimCustomer", "ID_Customer"),
+    )
+    return tables, _CLASSIFICATIONS_DIM_FACT, relationships
+
+
+@pytest.fixture(scope="session")
+def tmdl(
+    dim_fact_inputs: DimFactInputs,
+    dim_customer_table: TableMetadata,
+    active_relationship: Relationship,
+) -> SimpleNamespace:
+    """Every canonical generator output the module asserts on, generated once per session.
+
+    Attributes: database, empty_model, model (dimension + fact), unsorted_model (fact-first,
+    out of order), expressions ('test_catalog'), column (decimal Amount on dbo.FactSales),
+    partition (dbo.DimCustomer), table (dim_customer_table) and relationships
+    (active_relationship). Whole-model output lives in the separate all_tmdl_basic fixture.
+    """
+    table_names, classifications = dim_fact_inputs
+    unsorted_names = ["dbo.FactSales", "dbo.DimProduct", "dbo.DimCustomer"]
+    unsorted_classifications = {
+        ("dbo", "FactSales"): TableClassification.FACT,
+        ("dbo", "DimProduct"): TableClassification.DIMENSION,
+        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
+    }
+    return SimpleNamespace(
+        database=generate_database_tmdl(),
+        empty_model=generate_model_tmdl("TestModel", [], {}),
+        model=generate_model_tmdl("TestModel", table_names, classifications),
+        unsorted_model=generate_model_tmdl("TestModel", unsorted_names, unsorted_classifications),
+        expressions=generate_expressions_tmdl("test_catalog"),
+        column=render_column("Amount", "decimal", "dbo.FactSales"),
+        partition=render_partition("dbo", "DimCustomer", "my_warehouse"),
+        table=generate_table_tmdl(
+            dim_customer_table, TableClassification.DIMENSION, ["ID_"], "my_warehouse"
+        ),
+        relationships=generate_relationships_tmdl([active_relationship]),
+    )
 
 
-def test_generate_expressions_tmdl_passes_whitespace_validation() -> None:
-    """Expressions TMDL passes whitespace validation."""
-    output = generate_expressions_tmdl("test_catalog")
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
+# generate_database_tmdl tests
+def test_generate_database_tmdl_contains_database_header(tmdl: SimpleNamespace) -> None:
+    """Database TMDL contains 'database' as first line."""
+    assert lines_of(tmdl.database)[0] == "database"
 
 
-# generate_column_tmdl tests
-def test_generate_column_tmdl_starts_with_column_header() -> None:
-    """Column TMDL starts with 'column' and identifier."""
-    column = make_column("CustomerName", sql_type="varchar")
-    output = generate_column_tmdl(column, "dbo.DimCustomer")
+def test_generate_database_tmdl_contains_compatibility_level(tmdl: SimpleNamespace) -> None:
+    """Database TMDL contains compatibilityLevel: 1604."""
+    assert "\tcompatibilityLevel: 1604" in line_set(tmdl.database)
 
-    assert "\tcolumn CustomerName" in output
 
+# generate_model_tmdl tests
+def test_generate_model_tmdl_starts_with_model_header(tmdl: SimpleNamespace) -> None:
+    """Model TMDL starts with 'model Model'."""
+    assert lines_of(tmdl.empty_model)[0] == "model Model"
 
-def test_generate_column_tmdl_contains_data_type() -> None:
-    """Column TMDL contains dataType property."""
-    column = make_column("Amount", sql_type="decimal")
-    output = generate_column_tmdl(column, "dbo.FactSales")
 
-    # Should map decimal -> TmdlDataType.DECIMAL
-    assert "\t\tdataType: decimal" in output
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "\tculture: en-US",
+        "\tdefaultPowerBIDataSourceVersion: powerBI_V3",
+        "\tdiscourageImplicitMeasures",
+    ],
+)
+def test_generate_model_tmdl_contains(tmdl: SimpleNamespace, needle: str) -> None:
+    """Model TMDL contains culture, data source version and implicit measure settings."""
+    assert needle in line_set(tmdl.empty_model)
 
 
-def test_generate_column_tmdl_contains_lineage_tag() -> None:
-    """Column TMDL contains deterministic lineageTag."""
-    column = make_column("CustomerID", sql_type="bigint")
-    output = generate_column_tmdl(column, "dbo.DimCustomer")
+def test_generate_model_tmdl_contains_ref_table_lines(tmdl: SimpleNamespace) -> None:
+    """Model TMDL contains ref table lines for each table."""
+    assert {"\tref table DimCustomer", "\tref table FactSales"} <= line_set(tmdl.model)
 
-    assert "\t\tlineageTag:" in output
 
+def test_generate_model_tmdl_dimensions_before_facts(tmdl: SimpleNamespace) -> None:
+    """Model TMDL lists dimension tables before fact tables."""
+    seen = ref_table_order(tmdl.unsorted_model)
 
-def test_generate_column_tmdl_contains_summarize_by_none() -> None:
-    """Column TMDL contains summarizeBy: none."""
-    column = make_column("Amount", sql_type="decimal")
-    output = generate_column_tmdl(column, "dbo.FactSales")
+    # Dimensions should appear before facts
+    assert seen.index("DimCustomer") < seen.index("FactSales")
+    assert seen.index("DimProduct") < seen.index("FactSales")
 
-    assert "\t\tsummarizeBy: none" in output
 
+def test_generate_model_tmdl_alphabetical_within_classification(tmdl: SimpleNamespace) -> None:
+    """Model TMDL sorts tables alphabetically within same classification."""
+    seen = ref_table_order(tmdl.unsorted_model)
 
-def test_generate_column_tmdl_contains_source_column() -> None:
-    """Column TMDL contains sourceColumn with original name."""
-    column = make_column("CustomerName", sql_type="varchar")
-    output = generate_column_tmdl(column, "dbo.DimCustomer")
+    # DimCustomer should appear before DimProduct (alphabetical)
+    assert seen.index("DimCustomer") < seen.index("DimProduct")
 
-    assert "\t\tsourceColumn: CustomerName" in output
 
+def test_generate_model_tmdl_quotes_special_characters() -> None:
+    """Model TMDL quotes table names with special characters."""
+    table_names = ["dbo.Dim Customer"]  # Space in name
+    classifications = {("dbo", "Dim Customer"): TableClassification.DIMENSION}
+    output = generate_model_tmdl("TestModel", table_names, classifications)
 
-def test_generate_column_tmdl_quotes_names_with_spaces() -> None:
-    """Column TMDL quotes column names containing spaces."""
-    column = make_column("Customer Name", sql_type="varchar")
-    output = generate_column_tmdl(column, "dbo.DimCustomer")
+    assert f"\tref table {QUOTED_DIM_CUSTOMER}" in line_set(output)
 
-    quoted_name = quote_tmdl_identifier("Customer Name")
-    assert f"\tcolumn {quoted_name}" in output
 
+# generate_expressions_tmdl tests
+@pytest.mark.parametrize(
+    "needle",
+    [
+        # DirectLake expression named after the catalog
+        "expression 'DirectLake - test_catalog'",
+        "AzureStorage.DataLake",
+        "lineageTag:",
+        "annotation PBI_IncludeFutureArtifacts = False",
+        # en-US locale: English "Source" variable name
+        "Source = AzureStorage.DataLake",
+    ],
+)
+def test_generate_expressions_tmdl_contains(tmdl: SimpleNamespace, needle: str) -> None:
+    """Expressions TMDL contains the DirectLake expression parts."""
+    assert needle in tmdl.expressions
 
-def test_generate_column_tmdl_no_quotes_for_simple_names() -> None:
-    """Column TMDL doesn't quote simple column names."""
-    column = make_column("CustomerID", sql_type="bigint")
-    output = generate_column_tmdl(column, "dbo.DimCustomer")
 
-    # Simple name should not be quoted
-    assert "\tcolumn CustomerID" in output
-    assert "'" not in output.split("\n")[0]  # First line has no quotes
+def test_generate_expressions_tmdl_uses_en_us_locale(tmdl: SimpleNamespace) -> None:
+    """Expressions TMDL uses en-US locale (Source, not Swedish Kalla)."""
+    assert "Kalla" not in tmdl.expressions  # Swedish word should not appear
 
 
-def test_generate_column_tmdl_passes_whitespace_validation() -> None:
-    """Column TMDL passes whitespace validation."""
-    column = make_column("CustomerName", sql_type="varchar")
-    output = generate_column_tmdl(column, "dbo.DimCustomer")
+# generate_column_tmdl tests
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "\tcolumn Amount",
+        # decimal maps to TmdlDataType.DECIMAL
+        "\t\tdataType: decimal",
+        "\t\tsummarizeBy: none",
+        "\t\tsourceColumn: Amount",
+    ],
+)
+def test_generate_column_tmdl_contains(tmdl: SimpleNamespace, needle: str) -> None:
+    """Column TMDL contains header, dataType, summarizeBy and sourceColumn lines."""
+    assert needle in line_set(tmdl.column)
+
+
+@pytest.mark.parametrize(
+    ("name", "sql_type", "expected_header"),
+    [
+        # Names containing spaces are quoted
+        ("Customer Name", "varchar", f"\tcolumn {QUOTED_CUSTOMER_NAME}"),
+        # Simple names are not quoted
+        ("CustomerID", "bigint", "\tcolumn CustomerID"),
+    ],
+)
+def test_generate_column_tmdl_header_quoting(
+    name: str, sql_type: str, expected_header: str
+) -> None:
+    """Column TMDL quotes column names only when they need it."""
+    output = render_column(name, sql_type, "dbo.DimCustomer")
 
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
+    assert lines_of(output)[0] == expected_header
 
 
 # generate_partition_tmdl tests
-def test_generate_partition_tmdl_contains_partition_header() -> None:
-    """Partition TMDL contains partition header with name."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_partition_tmdl(table, "DimCustomer", "my_warehouse")
-
-    assert "\tpartition DimCustomer" in output or "\tpartition 'DimCustomer'" in output
-
-
-def test_generate_partition_tmdl_contains_mode_directlake() -> None:
-    """Partition TMDL contains mode: directLake."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_partition_tmdl(table, "DimCustomer", "my_warehouse")
-
-    assert "\t\tmode: directLake" in output
-
-
-def test_generate_partition_tmdl_contains_entity_name() -> None:
-    """Partition TMDL contains entityName with table name."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_partition_tmdl(table, "DimCustomer", "my_warehouse")
-
-    assert "\t\t\tentityName: DimCustomer" in output
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "\tpartition DimCustomer = entity",
+        "\t\tmode: directLake",
+        "\t\t\tentityName: DimCustomer",
+        "\t\t\texpressionSource: 'DirectLake - my_warehouse'",
+    ],
+)
+def test_generate_partition_tmdl_contains(tmdl: SimpleNamespace, needle: str) -> None:
+    """Partition TMDL contains header, directLake mode, entityName and expressionSource."""
+    assert needle in line_set(tmdl.partition)
 
 
 def test_generate_partition_tmdl_contains_schema_name() -> None:
     """Partition TMDL contains schemaName with schema name."""
-    table = make_table("sales", "Customer", [make_column("ID")])
-    output = generate_partition_tmdl(table, "Customer", "my_warehouse")
+    output = render_partition("sales", "Customer", "my_warehouse")
 
-    assert "\t\t\tschemaName: sales" in output
-
-
-def test_generate_partition_tmdl_contains_expression_source() -> None:
-    """Partition TMDL contains expressionSource reference."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_partition_tmdl(table, "DimCustomer", "my_warehouse")
-
-    assert "\t\t\texpressionSource: 'DirectLake - my_warehouse'" in output
-
-
-def test_generate_partition_tmdl_passes_whitespace_validation() -> None:
-    """Partition TMDL passes whitespace validation."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_partition_tmdl(table, "DimCustomer", "my_warehouse")
-
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
+    assert "\t\t\tschemaName: sales" in line_set(output)
 
 
 # generate_table_tmdl tests
-def test_generate_table_tmdl_starts_with_table_header() -> None:
+def test_generate_table_tmdl_starts_with_table_header(tmdl: SimpleNamespace) -> None:
     """Table TMDL starts with 'table' and identifier."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-
-    assert output.startswith("table ")
-
-
-def test_generate_table_tmdl_contains_lineage_tag() -> None:
-    """Table TMDL contains deterministic lineageTag."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-
-    assert "\tlineageTag:" in output
-
-
-def test_generate_table_tmdl_contains_all_columns() -> None:
-    """Table TMDL contains all column sections."""
-    columns = [
-        make_column("ID_Customer", sql_type="bigint", ordinal=1),
-        make_column("Name", sql_type="varchar", ordinal=2),
-        make_column("City", sql_type="varchar", ordinal=3),
-    ]
-    table = make_table("dbo", "DimCustomer", columns)
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-
-    assert "column ID_Customer" in output
-    assert "column Name" in output
-    assert "column City" in output
-
-
-def test_generate_table_tmdl_contains_partition_section() -> None:
-    """Table TMDL contains partition section."""
-    table = make_table("dbo", "DimCustomer", [make_column("ID")])
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-
-    assert "partition" in output
-    assert "mode: directLake" in output
+    assert tmdl.table.startswith("table ")
+
+
+@pytest.mark.parametrize(
+    "needle",
+    [
+        # All column sections
+        "\tcolumn ID_Customer",
+        "\tcolumn Name",
+        "\tcolumn City",
+        # Partition section
+        "\tpartition DimCustomer = entity",
+        "\t\tmode: directLake",
+    ],
+)
+def test_generate_table_tmdl_contains(tmdl: SimpleNamespace, needle: str) -> None:
+    """Table TMDL contains every column section and the partition section."""
+    assert needle in line_set(tmdl.table)
+
+
+@pytest.mark.parametrize(
+    ("output_name", "expected_line"),
+    [
+        (
+            "column",
+            f"\t\tlineageTag: {generate_deterministic_uuid('column', 'dbo.FactSales.Amount')}",
+        ),
+        ("table", f"\tlineageTag: {generate_deterministic_uuid('table', 'dbo.DimCustomer')}"),
+    ],
+)
+def test_generated_tmdl_contains_lineage_tag(
+    tmdl: SimpleNamespace, output_name: str, expected_line: str
+) -> None:
+    """Column and table TMDL carry the uuid5 lineageTag derived from their qualified name."""
+    assert expected_line in line_set(getattr(tmdl, output_name))
 
 
-def test_generate_table_tmdl_key_columns_first() -> None:
+def test_generate_table_tmdl_key_columns_first(tmdl: SimpleNamespace) -> None:
     """Table TMDL lists key columns before non-key columns."""
-    columns = [
-        make_column("Name", sql_type="varchar", ordinal=1),
-        make_column("ID_Customer", sql_type="bigint", ordinal=2),
-        make_column("City", sql_type="varchar", ordinal=3),
-    ]
-    table = make_table("dbo", "DimCustomer", columns)
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-
-    # Find positions of column definitions
-    id_customer_pos = output.find("column ID_Customer")
-    name_pos = output.find("column Name")
-    city_pos = output.find("column City")
+    pos = find_positions(tmdl.table, ["column ID_Customer", "column Name", "column City"])
 
     # ID_Customer (key) should appear before Name and City (non-keys)
-    assert id_customer_pos < name_pos
-    assert id_customer_pos < city_pos
+    assert pos["column ID_Customer"] < pos["column Name"]
+    assert pos["column ID_Customer"] < pos["column City"]
 
 
-def test_generate_table_tmdl_non_key_columns_alphabetical() -> None:
+def test_generate_table_tmdl_non_key_columns_alphabetical(tmdl: SimpleNamespace) -> None:
     """Table TMDL sorts non-key columns alphabetically."""
-    columns = [
-        make_column("ID_Customer", sql_type="bigint", ordinal=1),
-        make_column("Name", sql_type="varchar", ordinal=2),
-        make_column("City", sql_type="varchar", ordinal=3),
-    ]
-    table = make_table("dbo", "DimCustomer", columns)
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-
-    # Find positions
-    city_pos = output.find("column City")
-    name_pos = output.find("column Name")
+    pos = find_positions(tmdl.table, ["column City", "column Name"])
 
     # City should appear before Name (alphabetical)
-    assert city_pos < name_pos
-
+    assert pos["column City"] < pos["column Name"]
 
-def test_generate_table_tmdl_passes_whitespace_validation() -> None:
-    """Table TMDL passes whitespace validation."""
-    columns = [make_column("ID", sql_type="bigint")]
-    table = make_table("dbo", "DimCustomer", columns)
-    output = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
 
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
-
-
-# Determinism tests
-def test_generate_table_tmdl_is_deterministic() -> None:
+# Each test regenerates once and compares against the cached session output
+def test_generate_table_tmdl_is_deterministic(
+    dim_customer_table: TableMetadata, tmdl: SimpleNamespace
+) -> None:
     """Table TMDL generation produces identical output for same inputs."""
-    columns = [
-        make_column("ID_Customer", sql_type="bigint", ordinal=1),
-        make_column("Name", sql_type="varchar", ordinal=2),
-    ]
-    table = make_table("dbo", "DimCustomer", columns)
-
-    output1 = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
-    output2 = generate_table_tmdl(table, TableClassification.DIMENSION, ["ID_"], "my_warehouse")
+    output = generate_table_tmdl(
+        dim_customer_table, TableClassification.DIMENSION, ["ID_"], "my_warehouse"
+    )
 
-    assert output1 == output2
+    assert output == tmdl.table
 
 
-def test_generate_model_tmdl_is_deterministic() -> None:
+def test_generate_model_tmdl_is_deterministic(
+    dim_fact_inputs: DimFactInputs, tmdl: SimpleNamespace
+) -> None:
     """Model TMDL generation produces identical output for same inputs."""
-    table_names = ["dbo.DimCustomer", "dbo.FactSales"]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
+    table_names, classifications = dim_fact_inputs
 
-    output1 = generate_model_tmdl("TestModel", table_names, classifications)
-    output2 = generate_model_tmdl("TestModel", table_names, classifications)
+    output = generate_model_tmdl("TestModel", table_names, classifications)
 
-    assert output1 == output2
+    assert output == tmdl.model
 
 
 # generate_relationships_tmdl tests
-def test_generate_relationships_tmdl_single_active_relationship() -> None:
+def test_generate_relationships_tmdl_single_active_relationship(
+    active_relationship: Relationship, tmdl: SimpleNamespace
+) -> None:
     """Relationships TMDL with single active relationship contains correct syntax."""
-    rel = make_relationship(
-        "dbo.FactSales", "ID_Customer", "dbo.DimCustomer", "ID_Customer", is_active=True
-    )
-    output = generate_relationships_tmdl([rel])
+    lines = line_set(tmdl.relationships)
 
-    # Should contain relationship UUID
-    assert f"relationship {rel.id}" in output
-    # Should contain fromColumn with quoted table name and unquoted column
-    assert "fromColumn: 'FactSales'.ID_Customer" in output
-    # Should contain toColumn with quoted table name and unquoted column
-    assert "toColumn: 'DimCustomer'.ID_Customer" in output
+    # Relationship UUID header, then fromColumn/toColumn with quoted table, unquoted column
+    expected = {
+        f"relationship {active_relationship.id}",
+        "\tfromColumn: 'FactSales'.ID_Customer",
+        "\ttoColumn: 'DimCustomer'.ID_Customer",
+    }
+    assert expected <= lines
     # Active relationships should NOT have isActive line (default is true)
-    assert "isActive" not in output
+    assert "isActive" not in tmdl.relationships
 
 
 def test_generate_relationships_tmdl_inactive_relationship() -> None:
@@ -484,7 +488,7 @@ def test_generate_relationships_tmdl_inactive_relationship() -> None:
     )
     output = generate_relationships_tmdl([rel])
 
-    assert "isActive: false" in output
+    assert "\tisActive: false" in line_set(output)
 
 
 def test_generate_relationships_tmdl_multiple_relationships_sorted() -> None:
@@ -502,9 +506,13 @@ def test_generate_relationships_tmdl_multiple_relationships_sorted() -> None:
     output = generate_relationships_tmdl([rel1, rel2, rel3])
 
     # Find positions
-    pos_customer = output.find(f"relationship {rel2.id}")
-    pos_store = output.find(f"relationship {rel3.id}")
-    pos_product = output.find(f"relationship {rel1.id}")
+    header_product, header_customer, header_store = (
+        f"relationship {rel.id}" for rel in (rel1, rel2, rel3)
+    )
+    pos = find_positions(output, [header_product, header_customer, header_store])
+    pos_customer = pos[header_customer]
+    pos_store = pos[header_store]
+    pos_product = pos[header_product]
 
     # Active relationships (rel2, rel3) should appear before inactive (rel1)
     assert pos_customer < pos_product
@@ -527,147 +535,118 @@ def test_generate_relationships_tmdl_quotes_special_characters() -> None:
     output = generate_relationships_tmdl([rel])
 
     # Table names with spaces should be quoted
-    assert "'Fact Sales'.ID_Customer" in output
-    assert "'Dim Customer'.ID_Customer" in output
+    assert {
+        "\tfromColumn: 'Fact Sales'.ID_Customer",
+        "\ttoColumn: 'Dim Customer'.ID_Customer",
+    } <= line_set(output)
+
+
+# Whitespace validation across generators
+@pytest.fixture
+def tmdl_output(request: pytest.FixtureRequest, tmdl: SimpleNamespace) -> str:
+    """Resolve an indirect parameter naming one of the cached tmdl outputs."""
+    output: str = getattr(tmdl, request.param)
+    return output
+
+
+@pytest.mark.parametrize(
+    "tmdl_output",
+    [
+        "database",
+        "model",
+        "expressions",
+        "column",
+        "partition",
+        "table",
+        "relationships",
+    ],
+    indirect=True,
+)
+def test_generated_tmdl_passes_whitespace_validation(tmdl_output: str) -> None:
+    """Every generator's cached output passes whitespace validation (tabs only)."""
+    errors = validate_tmdl_indentation(tmdl_output)
+    assert errors == [], f"Validation errors: {errors}"
 
 
-def test_generate_relationships_tmdl_passes_whitespace_validation() -> None:
-    """Relationships TMDL passes whitespace validation."""
-    rel = make_relationship("dbo.FactSales", "ID_Customer", "dbo.DimCustomer", "ID_Customer")
-    output = generate_relationships_tmdl([rel])
+# generate_all_tmdl tests
+@pytest.fixture(scope="session")
+def all_tmdl_basic(all_tmdl_inputs: AllTmdlInputs) -> dict[str, str]:
+    """generate_all_tmdl output for all_tmdl_inputs, generated once per session.
 
-    errors = validate_tmdl_indentation(output)
-    assert len(errors) == 0, f"Validation errors: {errors}"
+    Kept out of the shared tmdl namespace so deselecting slow tests skips whole-model generation.
+    """
+    return render_all_tmdl(all_tmdl_inputs)
 
 
-# generate_all_tmdl tests
-def test_generate_all_tmdl_returns_all_required_file_paths() -> None:
-    """generate_all_tmdl returns dict with all required file paths."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer", ordinal=1)])
-    fact_table = make_table("dbo", "FactSales", [make_column("ID_Customer", ordinal=1)])
-    tables = [dim_table, fact_table]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
-    rel = make_relationship("dbo.FactSales", "ID_Customer", "dbo.DimCustomer", "ID_Customer")
-    relationships = [rel]
+@pytest.fixture(scope="session")
+def tmdl_paths(all_tmdl_basic: dict[str, str]) -> tuple[str, ...]:
+    """Paths of the .tmdl files in all_tmdl_basic, filtered once per session."""
+    return tuple(path for path in all_tmdl_basic if path.endswith(".tmdl"))
 
-    result = generate_all_tmdl(
-        model_name="TestModel",
-        tables=tables,
-        classifications=classifications,
-        relationships=relationships,
-        key_prefixes=["ID_"],
-        catalog_name="my_warehouse",
-    )
 
+@pytest.mark.slow
+def test_generate_all_tmdl_returns_all_required_file_paths(
+    all_tmdl_basic: dict[str, str],
+) -> None:
+    """generate_all_tmdl returns dict with all required file paths."""
     # Check all required file paths are present
-    assert ".platform" in result
-    assert "definition.pbism" in result
-    assert "definition/database.tmdl" in result
-    assert "definition/model.tmdl" in result
-    assert "definition/expressions.tmdl" in result
-    assert "definition/relationships.tmdl" in result
-    assert "definition/tables/DimCustomer.tmdl" in result
-    assert "definition/tables/FactSales.tmdl" in result
-    assert "diagramLayout.json" in result
-
-
-def test_generate_all_tmdl_all_tmdl_files_pass_validation() -> None:
-    """generate_all_tmdl produces TMDL files that pass whitespace validation."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer", ordinal=1)])
-    tables = [dim_table]
-    classifications = {("dbo", "DimCustomer"): TableClassification.DIMENSION}
-
-    result = generate_all_tmdl(
-        model_name="TestModel",
-        tables=tables,
-        classifications=classifications,
-        relationships=[],
-        key_prefixes=["ID_"],
-        catalog_name="my_warehouse",
+    required = {
+        ".platform",
+        "definition.pbism",
+        "definition/database.tmdl",
+        "definition/model.tmdl",
+        "definition/expressions.tmdl",
+        "definition/relationships.tmdl",
+        "definition/tables/DimCustomer.tmdl",
+        "definition/tables/FactSales.tmdl",
+        "diagramLayout.json",
+    }
+    assert required <= all_tmdl_basic.keys(), (
+        f"Missing paths: {sorted(required - all_tmdl_basic.keys())}"
     )
 
+
+@pytest.mark.slow
+def test_generate_all_tmdl_all_tmdl_files_pass_validation(
+    all_tmdl_basic: dict[str, str], tmdl_paths: tuple[str, ...]
+) -> None:
+    """generate_all_tmdl produces TMDL files that pass whitespace validation."""
     # Validate all TMDL files
-    for path, content in result.items():
-        if path.endswith(".tmdl"):
-            errors = validate_tmdl_indentation(content)
-            assert len(errors) == 0, f"{path} has indentation errors: {errors}"
+    for path in tmdl_paths:
+        errors = validate_tmdl_indentation(all_tmdl_basic[path])
+        assert errors == [], f"{path} has indentation errors: {errors}"
 
 
-def test_generate_all_tmdl_json_files_are_valid_json() -> None:
+@pytest.mark.slow
+def test_generate_all_tmdl_json_files_are_valid_json(all_tmdl_basic: dict[str, str]) -> None:
     """generate_all_tmdl produces valid JSON for .platform, definition.pbism, diagramLayout.json."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer", ordinal=1)])
-    tables = [dim_table]
-    classifications = {("dbo", "DimCustomer"): TableClassification.DIMENSION}
+    # Validate JSON files; a JSONDecodeError surfaces directly in the traceback
+    for json_file in (".platform", "definition.pbism", "diagramLayout.json"):
+        json.loads(all_tmdl_basic[json_file])
 
-    result = generate_all_tmdl(
-        model_name="TestModel",
-        tables=tables,
-        classifications=classifications,
-        relationships=[],
-        key_prefixes=["ID_"],
-        catalog_name="my_warehouse",
-    )
 
-    # Validate JSON files
-    json_files = [".platform", "definition.pbism", "diagramLayout.json"]
-    for json_file in json_files:
-        content = result[json_file]
-        try:
-            json.loads(content)
-        except json.JSONDecodeError as e:
-            raise AssertionError(f"{json_file} is not valid JSON: {e}") from e
-
-
-def test_generate_all_tmdl_is_deterministic() -> None:
+@pytest.mark.slow
+def test_generate_all_tmdl_is_deterministic(
+    all_tmdl_inputs: AllTmdlInputs, all_tmdl_basic: dict[str, str]
+) -> None:
     """generate_all_tmdl produces identical output for same inputs."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer", ordinal=1)])
-    fact_table = make_table("dbo", "FactSales", [make_column("ID_Customer", ordinal=1)])
-    tables = [dim_table, fact_table]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
-    rel = make_relationship("dbo.FactSales", "ID_Customer", "dbo.DimCustomer", "ID_Customer")
-    relationships = [rel]
-
-    result1 = generate_all_tmdl(
-        model_name="TestModel",
-        tables=tables,
-        classifications=classifications,
-        relationships=relationships,
-        key_prefixes=["ID_"],
-        catalog_name="my_warehouse",
-    )
-
-    result2 = generate_all_tmdl(
-        model_name="TestModel",
-        tables=tables,
-        classifications=classifications,
-        relationships=relationships,
-        key_prefixes=["ID_"],
-        catalog_name="my_warehouse",
-    )
+    result = render_all_tmdl(all_tmdl_inputs)
 
-    # Compare all keys and values
-    assert result1.keys() == result2.keys()
-    for key in result1.keys():
-        assert result1[key] == result2[key], f"Mismatch in {key}"
+    assert result == all_tmdl_basic
 
 
+@pytest.mark.slow
 def test_generate_all_tmdl_with_two_dimensions_and_one_fact() -> None:
     """generate_all_tmdl handles multiple dimensions and facts."""
-    dim_customer = make_table("dbo", "DimCustomer", [make_column("ID_Customer", ordinal=1)])
-    dim_product = make_table("dbo", "DimProduct", [make_column("ID_Product", ordinal=1)])
+    dim_customer = make_table("dbo", "DimCustomer", (make_column("ID_Customer", ordinal=1),))
+    dim_product = make_table("dbo", "DimProduct", (make_column("ID_Product", ordinal=1),))
     fact_sales = make_table(
         "dbo",
         "FactSales",
-        [
+        (
             make_column("ID_Customer", ordinal=1),
             make_column("ID_Product", ordinal=2),
-        ],
+        ),
     )
     tables = [dim_customer, dim_product, fact_sales]
     classifications = {
@@ -689,11 +668,12 @@ def test_generate_all_tmdl_with_two_dimensions_and_one_fact() -> None:
     )
 
     # Should have table files for all three tables
-    assert "definition/tables/DimCustomer.tmdl" in result
-    assert "definition/tables/DimProduct.tmdl" in result
-    assert "definition/tables/FactSales.tmdl" in result
+    assert {
+        "definition/tables/DimCustomer.tmdl",
+        "definition/tables/DimProduct.tmdl",
+        "definition/tables/FactSales.tmdl",
+    } <= result.keys()
 
     # Should have two relationships in relationships.tmdl
-    relationships_content = result["definition/relationships.tmdl"]
-    assert f"relationship {rel1.id}" in relationships_content
-    assert f"relationship {rel2.id}" in relationships_content
+    relationship_lines = line_set(result["definition/relationships.tmdl"])
+    assert {f"relationship {rel1.id}", f"relationship {rel2.id}"} <= relationship_lines
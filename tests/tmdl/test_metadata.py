@@ -1,6 +1,9 @@
 """Tests for TMDL metadata file generators."""
 
 import json
+from typing import Any
+
+import pytest
 
 from semantic_model_generator.domain.types import (
     ColumnMetadata,
@@ -13,6 +16,9 @@ from semantic_model_generator.tmdl.metadata import (
     generate_platform_json,
 )
 
+# (schema, table) -> classification map accepted by generate_diagram_layout_json
+Classifications = dict[tuple[str, str], TableClassification]
+
 
 # Helper functions
 def make_column(
@@ -30,169 +36,139 @@ def make_column(
     )
 
 
-def make_table(schema: str, table: str, columns: list[ColumnMetadata]) -> TableMetadata:
-    """Create a TableMetadata for testing."""
-    return TableMetadata(schema_name=schema, table_name=table, columns=tuple(columns))
+def make_table(schema: str, table: str, columns: tuple[ColumnMetadata, ...]) -> TableMetadata:
+    """Create a TableMetadata for testing; columns are used as-is, without copying."""
+    return TableMetadata(schema_name=schema, table_name=table, columns=columns)
 
 
-# generate_platform_json tests
-def test_generate_platform_json_is_valid_json() -> None:
-    """Platform JSON output is valid JSON."""
-    output = generate_platform_json("TestModel")
+def split_layout_entries(
+    data: dict[str, Any],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Split diagramLayout table entries into (dimensions, facts) by name in a single pass."""
+    dims: list[dict[str, Any]] = []
+    facts: list[dict[str, Any]] = []
+    for entry in data["tables"]:
+        if "Dim" in entry["name"]:
+            dims.append(entry)
+        elif "Fact" in entry["name"]:
+            facts.append(entry)
+    return dims, facts
 
-    try:
-        json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {e}") from e
 
+# generate_platform_json tests
+@pytest.fixture(scope="module")
+def platform_output() -> str:
+    """Platform JSON for TestModel, generated once per module."""
+    return generate_platform_json("TestModel")
 
-def test_generate_platform_json_contains_schema() -> None:
-    """Platform JSON contains $schema with fabric gitIntegration URL."""
-    output = generate_platform_json("TestModel")
-    data = json.loads(output)
 
-    assert "$schema" in data
-    assert "fabric/gitIntegration/platformProperties" in data["$schema"]
+@pytest.fixture(scope="module")
+def platform_data(platform_output: str) -> dict[str, Any]:
+    """Parsed platform_output; parsing fails the dependent tests if it is not valid JSON."""
+    data: dict[str, Any] = json.loads(platform_output)
+    return data
 
 
-def test_generate_platform_json_contains_semantic_model_type() -> None:
-    """Platform JSON metadata.type is SemanticModel."""
-    output = generate_platform_json("TestModel")
-    data = json.loads(output)
+def test_generate_platform_json_is_valid_json(platform_data: dict[str, Any]) -> None:
+    """Platform JSON output is valid JSON."""
+    assert isinstance(platform_data, dict)
 
-    assert "metadata" in data
-    assert data["metadata"]["type"] == "SemanticModel"
 
+def test_generate_platform_json_contains_schema(platform_data: dict[str, Any]) -> None:
+    """Platform JSON contains $schema with fabric gitIntegration URL."""
+    assert "fabric/gitIntegration/platformProperties" in platform_data["$schema"]
 
-def test_generate_platform_json_contains_display_name() -> None:
-    """Platform JSON metadata.displayName matches model_name argument."""
-    output = generate_platform_json("TestModel")
-    data = json.loads(output)
 
-    assert "metadata" in data
-    assert data["metadata"]["displayName"] == "TestModel"
+@pytest.mark.parametrize(
+    ("section", "key", "expected"),
+    [
+        ("metadata", "type", "SemanticModel"),
+        # displayName matches the model_name argument
+        ("metadata", "displayName", "TestModel"),
+        ("config", "version", "2.0"),
+    ],
+)
+def test_generate_platform_json_field(
+    platform_data: dict[str, Any], section: str, key: str, expected: str
+) -> None:
+    """Platform JSON metadata and config fields have their expected values."""
+    assert platform_data[section][key] == expected
 
 
-def test_generate_platform_json_contains_version() -> None:
-    """Platform JSON config.version is 2.0."""
-    output = generate_platform_json("TestModel")
+def test_generate_platform_json_escapes_display_name() -> None:
+    """Platform JSON escapes quotes, backslashes and non-ASCII characters in displayName."""
+    model_name = 'Sales "Q1" \\ Modèl'
+    output = generate_platform_json(model_name)
     data = json.loads(output)
 
-    assert "config" in data
-    assert data["config"]["version"] == "2.0"
+    assert data["metadata"]["displayName"] == model_name
 
 
-def test_generate_platform_json_contains_logical_id() -> None:
+def test_generate_platform_json_contains_logical_id(platform_data: dict[str, Any]) -> None:
     """Platform JSON config.logicalId is a valid UUID string."""
-    output = generate_platform_json("TestModel")
-    data = json.loads(output)
-
-    assert "config" in data
-    assert "logicalId" in data["config"]
+    logical_id = platform_data["config"]["logicalId"]
 
     # Check it's a valid UUID format
-    logical_id = data["config"]["logicalId"]
     assert isinstance(logical_id, str)
     assert len(logical_id) == 36  # UUID format: 8-4-4-4-12 with dashes
     assert logical_id.count("-") == 4
 
 
-def test_generate_platform_json_logical_id_is_deterministic() -> None:
-    """Platform JSON logicalId is deterministic (same model_name produces same UUID)."""
-    output1 = generate_platform_json("TestModel")
-    output2 = generate_platform_json("TestModel")
-
-    data1 = json.loads(output1)
-    data2 = json.loads(output2)
-
-    assert data1["config"]["logicalId"] == data2["config"]["logicalId"]
+def test_generate_platform_json_is_deterministic(platform_output: str) -> None:
+    """Platform JSON output, logicalId included, is deterministic for the same model_name."""
+    assert generate_platform_json("TestModel") == platform_output
 
 
-def test_generate_platform_json_is_deterministic() -> None:
-    """Platform JSON output is deterministic (sort_keys ensures stable key order)."""
-    output1 = generate_platform_json("TestModel")
-    output2 = generate_platform_json("TestModel")
-
-    assert output1 == output2
+# generate_definition_pbism_json tests
+@pytest.fixture(scope="module")
+def pbism_data() -> dict[str, Any]:
+    """Parsed definition.pbism for TestModel with description and author, built once."""
+    output = generate_definition_pbism_json(
+        "TestModel", description="Test description", author="Test Author"
+    )
+    data: dict[str, Any] = json.loads(output)
+    return data
 
 
-# generate_definition_pbism_json tests
-def test_generate_definition_pbism_json_is_valid_json() -> None:
+def test_generate_definition_pbism_json_is_valid_json(pbism_data: dict[str, Any]) -> None:
     """definition.pbism output is valid JSON."""
-    output = generate_definition_pbism_json("TestModel")
-
-    try:
-        json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {e}") from e
+    assert isinstance(pbism_data, dict)
 
 
-def test_generate_definition_pbism_json_contains_schema() -> None:
+def test_generate_definition_pbism_json_contains_schema(pbism_data: dict[str, Any]) -> None:
     """definition.pbism contains $schema with fabric semanticModel URL."""
-    output = generate_definition_pbism_json("TestModel")
-    data = json.loads(output)
+    assert "fabric/item/semanticModel/definitionProperties" in pbism_data["$schema"]
 
-    assert "$schema" in data
-    assert "fabric/item/semanticModel/definitionProperties" in data["$schema"]
 
-
-def test_generate_definition_pbism_json_contains_version() -> None:
+def test_generate_definition_pbism_json_contains_version(pbism_data: dict[str, Any]) -> None:
     """definition.pbism contains version field."""
-    output = generate_definition_pbism_json("TestModel")
-    data = json.loads(output)
-
-    assert "version" in data
     # Version should be a string like "4.2"
-    assert isinstance(data["version"], str)
-
-
-def test_generate_definition_pbism_json_contains_name() -> None:
-    """definition.pbism contains name field matching model_name argument."""
-    output = generate_definition_pbism_json("TestModel")
-    data = json.loads(output)
-
-    assert "name" in data
-    assert data["name"] == "TestModel"
-
-
-def test_generate_definition_pbism_json_contains_description() -> None:
-    """definition.pbism contains description field."""
-    output = generate_definition_pbism_json("TestModel", description="Test description")
-    data = json.loads(output)
-
-    assert "description" in data
-    assert data["description"] == "Test description"
-
+    assert isinstance(pbism_data["version"], str)
 
-def test_generate_definition_pbism_json_contains_author_when_provided() -> None:
-    """definition.pbism contains author field when author argument is provided."""
-    output = generate_definition_pbism_json("TestModel", author="Test Author")
-    data = json.loads(output)
-
-    assert "author" in data
-    assert data["author"] == "Test Author"
-
-
-def test_generate_definition_pbism_json_contains_created_at_timestamp() -> None:
-    """definition.pbism contains createdAt timestamp field."""
-    output = generate_definition_pbism_json("TestModel")
-    data = json.loads(output)
-
-    assert "createdAt" in data
-    # Check it's a valid ISO 8601 timestamp string
-    assert isinstance(data["createdAt"], str)
-    assert "T" in data["createdAt"]  # ISO format has T separator
 
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        # name matches the model_name argument
+        ("name", "TestModel"),
+        ("description", "Test description"),
+        ("author", "Test Author"),
+    ],
+)
+def test_generate_definition_pbism_json_field(
+    pbism_data: dict[str, Any], key: str, expected: str
+) -> None:
+    """definition.pbism name, description and author match the arguments."""
+    assert pbism_data[key] == expected
 
-def test_generate_definition_pbism_json_contains_modified_at_timestamp() -> None:
-    """definition.pbism contains modifiedAt timestamp field."""
-    output = generate_definition_pbism_json("TestModel")
-    data = json.loads(output)
 
-    assert "modifiedAt" in data
-    # Check it's a valid ISO 8601 timestamp string
-    assert isinstance(data["modifiedAt"], str)
-    assert "T" in data["modifiedAt"]
+@pytest.mark.parametrize("key", ["createdAt", "modifiedAt"])
+def test_generate_definition_pbism_json_contains_timestamp(
+    pbism_data: dict[str, Any], key: str
+) -> None:
+    """definition.pbism contains createdAt and modifiedAt ISO 8601 timestamps."""
+    assert isinstance(pbism_data[key], str)
+    assert "T" in pbism_data[key]  # ISO format has T separator
 
 
 def test_generate_definition_pbism_json_empty_author_handling() -> None:
@@ -215,13 +191,46 @@ def test_generate_definition_pbism_json_is_deterministic_with_fixed_timestamp()
 
 
 # generate_diagram_layout_json tests
-def test_generate_diagram_layout_json_is_valid_json() -> None:
-    """diagramLayout output is valid JSON."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer")])
-    tables = [dim_table]
-    classifications = {("dbo", "DimCustomer"): TableClassification.DIMENSION}
+@pytest.fixture(scope="module")
+def dim_customer() -> TableMetadata:
+    """Dimension dbo.DimCustomer, shared by every diagram layout test."""
+    return make_table("dbo", "DimCustomer", (make_column("ID_Customer"),))
+
 
-    output = generate_diagram_layout_json(tables, classifications)
+@pytest.fixture(scope="module")
+def dim_product() -> TableMetadata:
+    """Dimension dbo.DimProduct, shared by every diagram layout test."""
+    return make_table("dbo", "DimProduct", (make_column("ID_Product"),))
+
+
+@pytest.fixture(scope="module")
+def fact_sales() -> TableMetadata:
+    """Fact dbo.FactSales, shared by every diagram layout test."""
+    return make_table("dbo", "FactSales", (make_column("ID_Customer"),))
+
+
+@pytest.fixture(scope="module")
+def fact_orders() -> TableMetadata:
+    """Fact dbo.FactOrders, shared by every diagram layout test."""
+    return make_table("dbo", "FactOrders", (make_column("ID_Order"),))
+
+
+@pytest.fixture(scope="module")
+def classifications() -> Classifications:
+    """Classifications for all shared tables; the generator only looks up tables it is given."""
+    return {
+        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
+        ("dbo", "DimProduct"): TableClassification.DIMENSION,
+        ("dbo", "FactSales"): TableClassification.FACT,
+        ("dbo", "FactOrders"): TableClassification.FACT,
+    }
+
+
+def test_generate_diagram_layout_json_is_valid_json(
+    dim_customer: TableMetadata, classifications: Classifications
+) -> None:
+    """diagramLayout output is valid JSON."""
+    output = generate_diagram_layout_json([dim_customer], classifications)
 
     try:
         json.loads(output)
@@ -229,33 +238,27 @@ def test_generate_diagram_layout_json_is_valid_json() -> None:
         raise AssertionError(f"Output is not valid JSON: {e}") from e
 
 
-def test_generate_diagram_layout_json_contains_tables_array() -> None:
+def test_generate_diagram_layout_json_contains_tables_array(
+    dim_customer: TableMetadata, classifications: Classifications
+) -> None:
     """diagramLayout contains tables array."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer")])
-    tables = [dim_table]
-    classifications = {("dbo", "DimCustomer"): TableClassification.DIMENSION}
-
-    output = generate_diagram_layout_json(tables, classifications)
+    output = generate_diagram_layout_json([dim_customer], classifications)
     data = json.loads(output)
 
     assert "tables" in data
     assert isinstance(data["tables"], list)
 
 
-def test_generate_diagram_layout_json_facts_positioned_in_left_column() -> None:
+def test_generate_diagram_layout_json_facts_positioned_in_left_column(
+    fact_sales: TableMetadata,
+    fact_orders: TableMetadata,
+    classifications: Classifications,
+) -> None:
     """diagramLayout positions fact tables in a vertical column (same x coordinate)."""
-    fact1 = make_table("dbo", "FactSales", [make_column("ID")])
-    fact2 = make_table("dbo", "FactOrders", [make_column("ID")])
-    tables = [fact1, fact2]
-    classifications = {
-        ("dbo", "FactSales"): TableClassification.FACT,
-        ("dbo", "FactOrders"): TableClassification.FACT,
-    }
-
-    output = generate_diagram_layout_json(tables, classifications)
+    output = generate_diagram_layout_json([fact_sales, fact_orders], classifications)
     data = json.loads(output)
 
-    fact_tables = [t for t in data["tables"] if "Fact" in t["name"]]
+    _, fact_tables = split_layout_entries(data)
     assert len(fact_tables) == 2
 
     # All fact tables should have the same x coordinate (vertical column)
@@ -263,21 +266,16 @@ def test_generate_diagram_layout_json_facts_positioned_in_left_column() -> None:
     assert len(set(x_coords)) == 1, "All facts should have same x coordinate"
 
 
-def test_generate_diagram_layout_json_dimensions_positioned_differently() -> None:
+def test_generate_diagram_layout_json_dimensions_positioned_differently(
+    dim_customer: TableMetadata,
+    fact_sales: TableMetadata,
+    classifications: Classifications,
+) -> None:
     """diagramLayout positions dimension tables with different x from facts column."""
-    dim1 = make_table("dbo", "DimCustomer", [make_column("ID")])
-    fact1 = make_table("dbo", "FactSales", [make_column("ID")])
-    tables = [dim1, fact1]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
-
-    output = generate_diagram_layout_json(tables, classifications)
+    output = generate_diagram_layout_json([dim_customer, fact_sales], classifications)
     data = json.loads(output)
 
-    dim_tables = [t for t in data["tables"] if "Dim" in t["name"]]
-    fact_tables = [t for t in data["tables"] if "Fact" in t["name"]]
+    dim_tables, fact_tables = split_layout_entries(data)
 
     assert len(dim_tables) > 0
     assert len(fact_tables) > 0
@@ -288,13 +286,11 @@ def test_generate_diagram_layout_json_dimensions_positioned_differently() -> Non
     assert dim_x != fact_x, "Dimensions and facts should be in different columns"
 
 
-def test_generate_diagram_layout_json_each_table_has_required_fields() -> None:
+def test_generate_diagram_layout_json_each_table_has_required_fields(
+    dim_customer: TableMetadata, classifications: Classifications
+) -> None:
     """diagramLayout table entries have name, x, y, width, height fields."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer")])
-    tables = [dim_table]
-    classifications = {("dbo", "DimCustomer"): TableClassification.DIMENSION}
-
-    output = generate_diagram_layout_json(tables, classifications)
+    output = generate_diagram_layout_json([dim_customer], classifications)
     data = json.loads(output)
 
     for table_entry in data["tables"]:
@@ -305,34 +301,27 @@ def test_generate_diagram_layout_json_each_table_has_required_fields() -> None:
         assert "height" in table_entry
 
 
-def test_generate_diagram_layout_json_table_count_matches_input() -> None:
+def test_generate_diagram_layout_json_table_count_matches_input(
+    dim_customer: TableMetadata,
+    dim_product: TableMetadata,
+    fact_sales: TableMetadata,
+    classifications: Classifications,
+) -> None:
     """diagramLayout table count matches input table count (excluding unclassified)."""
-    dim1 = make_table("dbo", "DimCustomer", [make_column("ID")])
-    dim2 = make_table("dbo", "DimProduct", [make_column("ID")])
-    fact1 = make_table("dbo", "FactSales", [make_column("ID")])
-    tables = [dim1, dim2, fact1]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "DimProduct"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
-
-    output = generate_diagram_layout_json(tables, classifications)
+    output = generate_diagram_layout_json([dim_customer, dim_product, fact_sales], classifications)
     data = json.loads(output)
 
     # Should have 3 tables in layout
     assert len(data["tables"]) == 3
 
 
-def test_generate_diagram_layout_json_is_deterministic() -> None:
+def test_generate_diagram_layout_json_is_deterministic(
+    dim_customer: TableMetadata,
+    fact_sales: TableMetadata,
+    classifications: Classifications,
+) -> None:
     """diagramLayout is deterministic (same input produces same output)."""
-    dim_table = make_table("dbo", "DimCustomer", [make_column("ID_Customer")])
-    fact_table = make_table("dbo", "FactSales", [make_column("ID_Customer")])
-    tables = [dim_table, fact_table]
-    classifications = {
-        ("dbo", "DimCustomer"): TableClassification.DIMENSION,
-        ("dbo", "FactSales"): TableClassification.FACT,
-    }
+    tables = [dim_customer, fact_sales]
 
     output1 = generate_diagram_layout_json(tables, classifications)
     output2 = generate_diagram_layout_json(tables, classifications)
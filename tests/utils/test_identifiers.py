@@ -83,6 +83,11 @@ class TestUnquoting:
         """Unquoting complex quoted name."""
         assert unquote_tmdl_identifier("'It''s a.test'") == "It's a.test"
 
+    @pytest.mark.parametrize("name", ["'Sales", "Sales'", "O'Brien"])
+    def test_unquote_unbalanced_quotes_unchanged(self, name):
+        """Unquoting leaves names without both outer quotes unchanged."""
+        assert unquote_tmdl_identifier(name) == name
+
 
 class TestRoundTrip:
     """Test that quote/unquote is idempotent."""
@@ -25,6 +25,11 @@ class TestDeterminism:
         uuid2 = generate_deterministic_uuid("column", "Sales.Amount")
         assert uuid1 == uuid2
 
+    def test_matches_direct_uuid5_of_normalized_name(self):
+        """Result equals uuid5 over the normalized "type:name" composite."""
+        expected = uuid.uuid5(SEMANTIC_MODEL_NAMESPACE, "table:Sales")
+        assert generate_deterministic_uuid(" Table ", "Sales ") == expected
+
 
 class TestDifferentInputs:
     """Test that different inputs produce different UUIDs."""
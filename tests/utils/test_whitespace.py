@@ -80,6 +80,13 @@ class TestInvalidTmdl:
         assert len(errors) == 1
         assert errors[0].line_number == 2
 
+    def test_line_numbers_across_blank_and_valid_lines(self):
+        """Line numbers stay correct when errors are separated by blank and tab lines."""
+        content = "table Sales\n\n  column A\n\tcolumn B\n\n line six\n"
+        errors = validate_tmdl_indentation(content)
+        assert [e.line_number for e in errors] == [3, 6]
+        assert [e.line_content for e in errors] == ["  column A", " line six"]
+
     def test_four_spaces(self):
         """Four leading spaces produce error mentioning 4 spaces."""
         content = "    column Name"
@@ -138,6 +145,11 @@ class TestIndentHelper:
         """indent_tmdl(3) returns three tabs."""
         assert indent_tmdl(3) == "\t\t\t"
 
+    def test_indent_beyond_precomputed_levels(self):
+        """Levels past the precomputed table still return the right number of tabs."""
+        assert indent_tmdl(15) == "\t" * 15
+        assert indent_tmdl(20) == "\t" * 20
+
     def test_indent_negative_raises_error(self):
         """indent_tmdl(-1) raises ValueError."""
         with pytest.raises(ValueError, match="level must be non-negative"):